@@ -18,12 +18,14 @@ from typing import List, Optional
 # Lokale Imports
 from mistralcli import (
     get_client,
+    list_models,
     logger,
     DEFAULT_MODEL,
     DEFAULT_TEMPERATURE,
     DEFAULT_MAX_TOKENS,
     get_version,
 )
+from mistralcli.core.config import YES_ANSWERS
 from mistralcli.security import is_dangerous_command
 from mistralcli.auth import (
     setup_api_key_interactive,
@@ -156,7 +158,7 @@ echo "Hello World" > hello.txt"""
         # Bestätigung einholen
         if not args.yes:
             response_input = input("\nBefehle ausführen? (y/n): ").strip().lower()
-            if response_input not in ['y', 'yes', 'j', 'ja']:
+            if response_input not in YES_ANSWERS:
                 print("Abgebrochen.")
                 logger.info("Benutzer hat Ausführung abgebrochen")
                 return
@@ -190,7 +192,7 @@ echo "Hello World" > hello.txt"""
                     print(f"Warnung: Befehl schlug fehl mit Exit-Code {result.returncode}", file=sys.stderr)
                     if not args.force:
                         cont = input("Fortfahren? (y/n): ").strip().lower()
-                        if cont not in ['y', 'yes', 'j', 'ja']:
+                        if cont not in YES_ANSWERS:
                             print("Abgebrochen.")
                             return
 
@@ -221,20 +223,20 @@ def cmd_models(args: argparse.Namespace) -> None:
     Args:
         args: Kommandozeilen-Argumente
     """
-    client = get_client()
     logger.info("Rufe Modellliste ab")
 
     try:
-        models = client.models.list()
+        # Zwischengespeichert (MODELS_CACHE_TTL), siehe list_models
+        models = list_models()
         print("Verfügbare Mistral Modelle:\n")
 
-        for model in models.data:
-            print(f"  - {model.id}")
-            if hasattr(model, 'description') and model.description:
-                print(f"    {model.description}")
+        for model in models:
+            print(f"  - {model['id']}")
+            if model['description']:
+                print(f"    {model['description']}")
             print()
         
-        logger.info(f"{len(models.data)} Modelle gefunden")
+        logger.info(f"{len(models)} Modelle gefunden")
 
     except Exception as e:
         logger.error(f"Modellabruf fehlgeschlagen: {e}")
@@ -356,7 +358,7 @@ def cmd_auth_delete(args: argparse.Namespace) -> None:
         print("\n⚠️  WARNUNG: Dies löscht den gespeicherten API-Key.")
         try:
             response = input("Fortfahren? [j/N]: ").strip().lower()
-            if response not in ['j', 'ja', 'y', 'yes']:
+            if response not in YES_ANSWERS:
                 print("Abgebrochen.")
                 sys.exit(0)
         except (EOFError, KeyboardInterrupt):
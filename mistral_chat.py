@@ -165,8 +165,8 @@ from mistralcli import (
     DEFAULT_TEMPERATURE,
     DEFAULT_MAX_TOKENS,
 )
-from mistralcli.utils import trim_messages
-from mistralcli.tools import TOOLS, execute_tool
+from mistralcli.utils import trim_messages, truncate_tool_content, json_loads, json_dumps
+from mistralcli.tools import TOOLS, execute_tools_batch
 
 
 # ============================================================================
@@ -250,35 +250,38 @@ def process_tool_calls(
         "tool_calls": assistant_message.tool_calls
     })
 
-    # Führe alle Tool Calls aus
+    # Argumente aller Tool Calls parsen
+    parsed_calls = []
     for tool_call in assistant_message.tool_calls:
         tool_name = tool_call.function.name
-        
+
         try:
-            tool_args = json.loads(tool_call.function.arguments)
+            tool_args = json_loads(tool_call.function.arguments)
         except json.JSONDecodeError as e:
             logger.error(f"JSON-Parsing-Fehler für Tool {tool_name}: {e}")
-            tool_result = {"success": False, "error": f"Ungültige Tool-Argumente: {e}"}
-            messages.append({
-                "role": "tool",
-                "name": tool_name,
-                "content": json.dumps(tool_result),
-                "tool_call_id": tool_call.id
-            })
+            error_result = {"success": False, "error": f"Ungültige Tool-Argumente: {e}"}
+            parsed_calls.append((tool_call, tool_name, None, error_result))
             continue
 
         logger.info(f"Tool-Call: {tool_name} mit Args: {tool_args}")
+        parsed_calls.append((tool_call, tool_name, tool_args, None))
 
-        # Tool ausführen
-        tool_result = execute_tool(tool_name, tool_args, auto_confirm=auto_confirm)
-        
-        logger.debug(f"Tool-Ergebnis: {tool_result}")
+    # Tools ausführen (reine Lese-Tools laufen parallel)
+    batch_results = iter(execute_tools_batch(
+        [(tool_name, tool_args) for _, tool_name, tool_args, error in parsed_calls if error is None],
+        auto_confirm=auto_confirm
+    ))
+
+    for tool_call, tool_name, _, error_result in parsed_calls:
+        tool_result = error_result if error_result is not None else next(batch_results)
+
+        logger.debug("Tool-Ergebnis: %s", tool_result)
 
         # Tool-Ergebnis zu Messages hinzufügen
         messages.append({
             "role": "tool",
             "name": tool_name,
-            "content": json.dumps(tool_result),
+            "content": truncate_tool_content(json_dumps(tool_result)),
             "tool_call_id": tool_call.id
         })
 
@@ -377,7 +380,7 @@ def cmd_chat(args: argparse.Namespace) -> None:
             # Token-Management: Kürze Messages wenn nötig
             messages = trim_messages(messages, max_tokens=8000)
 
-            logger.debug(f"Sende {len(messages)} Nachrichten an API")
+            logger.debug("Sende %d Nachrichten an API", len(messages))
 
             # API-Anfrage mit Tools senden
             response = client.chat.complete(
@@ -413,7 +416,7 @@ def cmd_chat(args: argparse.Namespace) -> None:
             if assistant_message and assistant_message.content:
                 messages.append({"role": "assistant", "content": assistant_message.content})
                 print(f"\nMistral: {assistant_message.content}\n")
-                logger.debug(f"Antwort: {assistant_message.content[:100]}...")
+                logger.debug("Antwort: %.100s...", assistant_message.content)
             else:
                 print()
 
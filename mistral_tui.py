@@ -5,7 +5,8 @@ Mistral CLI - TUI (Text User Interface) mit Textual
 
 import os
 import sys
-import json
+import asyncio
+import functools
 import subprocess
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical, ScrollableContainer
@@ -17,8 +18,9 @@ from textual.binding import Binding
 from textual import on
 
 # Lokale Imports
-from mistralcli import get_client
-from mistralcli.tools import TOOLS, execute_tool
+from mistralcli import get_client, list_models
+from mistralcli.tools import TOOLS, execute_tools_batch
+from mistralcli.utils import trim_messages, truncate_tool_content, json_loads, json_dumps
 
 
 # ASCII Logo für Mistral CLI
@@ -56,6 +58,10 @@ COMPACT_LOGO = r"""
 """
 
 
+# Markiert das Ende eines Chat-Streams in der Queue
+_STREAM_END = object()
+
+
 class MistralTUI(App):
     """Hauptanwendung für Mistral CLI TUI"""
 
@@ -198,7 +204,9 @@ class MistralTUI(App):
         """Models-Tab Komponenten"""
         with Vertical():
             yield Label("Available Mistral Models")
-            yield Button("Load Models", id="models_load", variant="primary")
+            with Horizontal():
+                yield Button("Load Models", id="models_load", variant="primary")
+                yield Button("Refresh", id="models_refresh")
             yield DataTable(id="models_table")
 
     def _compose_complete_tab(self):
@@ -212,19 +220,19 @@ class MistralTUI(App):
     def _compose_settings_tab(self):
         """Settings-Tab Komponenten"""
         with Vertical(classes="settings-container"):
-            yield Label(f"Current Model: {self.current_model}")
+            yield Label(f"Current Model: {self.current_model}", id="model_label")
             yield Input(
                 placeholder="Enter model name...",
                 id="model_input",
                 value=self.current_model
             )
-            yield Label(f"Temperature: {self.temperature}")
+            yield Label(f"Temperature: {self.temperature}", id="temp_label")
             yield Input(
                 placeholder="0.0 - 1.0",
                 id="temp_input",
                 value=str(self.temperature)
             )
-            yield Label(f"Max Tokens: {self.max_tokens}")
+            yield Label(f"Max Tokens: {self.max_tokens}", id="tokens_label")
             yield Input(
                 placeholder="Max Tokens",
                 id="tokens_input",
@@ -235,31 +243,120 @@ class MistralTUI(App):
 
     def on_mount(self) -> None:
         """Wird beim Start der App aufgerufen"""
+        # Widget-Referenzen einmal auflösen statt bei jedem Event den DOM zu durchsuchen
+        self._chat_input = self.query_one("#chat_input", Input)
+        self._chat_log = self.query_one("#chat_log", RichLog)
+        self._tool_log = self.query_one("#tool_log", RichLog)
+        self._exec_input = self.query_one("#exec_input", Input)
+        self._exec_log = self.query_one("#exec_log", RichLog)
+        self._models_table = self.query_one("#models_table", DataTable)
+        self._complete_input = self.query_one("#complete_input", Input)
+        self._complete_log = self.query_one("#complete_log", RichLog)
+
         # Initialisiere Mistral Client
-        api_key = os.environ.get('MISTRAL_API_KEY')
-        if not api_key:
+        # (get_client() würde ohne Key interaktiv nachfragen - nicht in der TUI)
+        if not os.environ.get('MISTRAL_API_KEY'):
             self.exit(message="ERROR: MISTRAL_API_KEY not set!\n" +
                      "Please set: export MISTRAL_API_KEY='your-api-key'")
+            return
 
-        self.client = get_client(api_key=api_key)
+        # Singleton - teilt den Connection-Pool mit allen weiteren Aufrufen
+        self.client = get_client()
 
         # Willkommensnachricht im Chat
-        chat_log = self.query_one("#chat_log", RichLog)
+        chat_log = self._chat_log
         chat_log.write("✨ Welcome to Mistral CLI!")
         chat_log.write(f"🤖 Model: {self.current_model}")
         chat_log.write("💡 Tip: Use tabs above to switch between different modes\n")
 
+    async def _run_blocking(self, func, *args, **kwargs):
+        """Führt einen blockierenden Aufruf im Thread aus, damit die Oberfläche bedienbar bleibt"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, functools.partial(func, *args, **kwargs))
+
+    async def _stream_chat(self, chat_log: RichLog, **kwargs):
+        """
+        Streamt eine Chat-Antwort und schreibt den Text zeilenweise ins Log.
+
+        Der Stream wird im Thread gelesen und über eine asyncio.Queue an die
+        Oberfläche übergeben. Gibt (content, tool_calls) zurück; tool_calls
+        sind Dicts im Nachrichtenformat der API.
+        """
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+
+        def produce():
+            try:
+                for event in self.client.chat.stream(**kwargs):
+                    if event.data.choices:
+                        loop.call_soon_threadsafe(queue.put_nowait, event.data.choices[0].delta)
+            finally:
+                loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+
+        producer = loop.run_in_executor(None, produce)
+
+        parts = []
+        pending = ""
+        prefix = "\n🤖 Mistral: "
+        # index -> Tool Call (die Argumente kommen in Fragmenten)
+        tool_calls = {}
+
+        while True:
+            delta = await queue.get()
+            if delta is _STREAM_END:
+                break
+
+            if isinstance(delta.content, str) and delta.content:
+                parts.append(delta.content)
+                # RichLog schreibt nur ganze Zeilen - fertige Zeilen sofort ausgeben
+                lines = (pending + delta.content).split("\n")
+                pending = lines.pop()
+                for line in lines:
+                    chat_log.write(prefix + line)
+                    prefix = ""
+
+            for tool_call in delta.tool_calls or ():
+                arguments = tool_call.function.arguments
+                if not isinstance(arguments, str):
+                    arguments = json_dumps(arguments)
+                # Fragmente desselben Tool Calls tragen denselben index
+                index = getattr(tool_call, "index", None)
+                tool_call_id = getattr(tool_call, "id", None)
+                if index is None:
+                    index = len(tool_calls)
+                entry = tool_calls.get(index)
+                if entry is None:
+                    tool_calls[index] = {
+                        "id": tool_call_id,
+                        "type": "function",
+                        "function": {"name": tool_call.function.name, "arguments": arguments}
+                    }
+                else:
+                    # Fortsetzung: Argumente anhängen, fehlende ID/Name nachtragen
+                    entry["function"]["arguments"] += arguments
+                    if tool_call_id and tool_call_id != "null":
+                        entry["id"] = tool_call_id
+                    if tool_call.function.name and not entry["function"]["name"]:
+                        entry["function"]["name"] = tool_call.function.name
+
+        # Fehler aus dem Stream weitergeben
+        await producer
+
+        if pending:
+            chat_log.write(prefix + pending)
+        return "".join(parts), [tool_calls[index] for index in sorted(tool_calls)]
+
     @on(Button.Pressed, "#chat_send")
     async def send_chat_message(self) -> None:
         """Sende Chat-Nachricht"""
-        chat_input = self.query_one("#chat_input", Input)
+        chat_input = self._chat_input
         message = chat_input.value.strip()
 
         if not message:
             return
 
-        chat_log = self.query_one("#chat_log", RichLog)
-        tool_log = self.query_one("#tool_log", RichLog)
+        chat_log = self._chat_log
+        tool_log = self._tool_log
 
         # Zeige Benutzernachricht
         chat_log.write(f"\n👤 You: {message}")
@@ -268,11 +365,15 @@ class MistralTUI(App):
         # Füge zu Messages hinzu
         self.chat_messages.append({"role": "user", "content": message})
 
+        # Token-Management: Kürze Messages wenn nötig
+        self.chat_messages = trim_messages(self.chat_messages, max_tokens=8000)
+
         try:
-            # API-Anfrage
+            # API-Anfrage (Antwort wird während der Generierung angezeigt)
             chat_log.write("🤔 Mistral is thinking...")
 
-            response = self.client.chat.complete(
+            content, tool_calls = await self._stream_chat(
+                chat_log,
                 model=self.current_model,
                 messages=self.chat_messages,
                 temperature=self.temperature,
@@ -281,41 +382,50 @@ class MistralTUI(App):
                 tool_choice="auto"
             )
 
-            assistant_message = response.choices[0].message
-
             # Prüfe auf Tool Calls
-            if assistant_message.tool_calls:
-                tool_log.write("\n🔧 Executing tools:")
+            if tool_calls:
+                # Log-Zeilen gesammelt schreiben - ein Render-Durchlauf statt einer pro Zeile
+                log_lines = ["\n🔧 Executing tools:"]
 
                 # Füge Assistant-Nachricht hinzu
                 self.chat_messages.append({
                     "role": "assistant",
-                    "content": assistant_message.content or "",
-                    "tool_calls": assistant_message.tool_calls
+                    "content": content,
+                    "tool_calls": tool_calls
                 })
 
                 # Führe Tools aus
-                for tool_call in assistant_message.tool_calls:
-                    tool_name = tool_call.function.name
-                    tool_args = json.loads(tool_call.function.arguments)
+                calls = []
+                for tool_call in tool_calls:
+                    tool_name = tool_call["function"]["name"]
+                    tool_args = json_loads(tool_call["function"]["arguments"])
+
+                    log_lines.append(f"▶️ {tool_name}: {tool_args}")
+                    calls.append((tool_name, tool_args))
 
-                    tool_log.write(f"▶️ {tool_name}: {tool_args}")
+                tool_log.write("\n".join(log_lines))
 
-                    # Tool ausführen (auto-confirm für TUI)
-                    tool_result = execute_tool(tool_name, tool_args, auto_confirm=True)
+                # Tools ausführen (auto-confirm für TUI, Lese-Tools parallel)
+                tool_results = await self._run_blocking(execute_tools_batch, calls, auto_confirm=True)
 
-                    tool_log.write(f"✅ Result: {json.dumps(tool_result, ensure_ascii=False)[:200]}")
+                log_lines = []
+                for tool_call, (tool_name, _), tool_result in zip(tool_calls, calls, tool_results):
+                    result_json = json_dumps(tool_result)
+                    log_lines.append(f"✅ Result: {result_json[:200]}")
 
-                    # Tool-Ergebnis zu Messages hinzufügen
+                    # Tool-Ergebnis zu Messages hinzufügen (gekürzt, wird bei jeder Anfrage mitgesendet)
                     self.chat_messages.append({
                         "role": "tool",
                         "name": tool_name,
-                        "content": json.dumps(tool_result),
-                        "tool_call_id": tool_call.id
+                        "content": truncate_tool_content(result_json),
+                        "tool_call_id": tool_call["id"]
                     })
 
+                tool_log.write("\n".join(log_lines))
+
                 # Zweite API-Anfrage
-                response = self.client.chat.complete(
+                content, _ = await self._stream_chat(
+                    chat_log,
                     model=self.current_model,
                     messages=self.chat_messages,
                     temperature=self.temperature,
@@ -324,12 +434,9 @@ class MistralTUI(App):
                     tool_choice="auto"
                 )
 
-                assistant_message = response.choices[0].message
-
-            # Zeige finale Antwort
-            if assistant_message.content:
-                self.chat_messages.append({"role": "assistant", "content": assistant_message.content})
-                chat_log.write(f"\n🤖 Mistral: {assistant_message.content}")
+            # Finale Antwort (bereits angezeigt) zum Verlauf hinzufügen
+            if content:
+                self.chat_messages.append({"role": "assistant", "content": content})
 
         except Exception as e:
             chat_log.write(f"\n❌ Error: {str(e)}")
@@ -342,13 +449,13 @@ class MistralTUI(App):
     @on(Button.Pressed, "#exec_generate")
     async def generate_exec_commands(self) -> None:
         """Generiere Bash-Befehle"""
-        exec_input = self.query_one("#exec_input", Input)
+        exec_input = self._exec_input
         task = exec_input.value.strip()
 
         if not task:
             return
 
-        exec_log = self.query_one("#exec_log", RichLog)
+        exec_log = self._exec_log
         exec_log.write(f"\n📋 Task: {task}")
         exec_log.write("🤔 Generating commands...")
 
@@ -361,7 +468,8 @@ IMPORTANT:
 - Start directly with the commands"""
 
         try:
-            response = self.client.chat.complete(
+            response = await self._run_blocking(
+                self.client.chat.complete,
                 model=self.current_model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -373,50 +481,69 @@ IMPORTANT:
 
             commands_text = response.choices[0].message.content.strip()
 
-            # Speichere Commands für Ausführung
-            self.pending_commands = [
-                cmd.strip() for cmd in commands_text.split('\n')
-                if cmd.strip() and not cmd.strip().startswith('#')
-            ]
+            # Speichere Commands für Ausführung (ohne Leer- und Kommentarzeilen)
+            lines = (line.strip() for line in commands_text.splitlines())
+            self.pending_commands = [cmd for cmd in lines if cmd and not cmd.startswith('#')]
 
-            exec_log.write("\n✅ Generated Commands:")
-            exec_log.write("─" * 50)
-            for i, cmd in enumerate(self.pending_commands, 1):
-                exec_log.write(f"{i}. {cmd}")
-            exec_log.write("─" * 50)
-            exec_log.write("⚠️ Click 'Execute' to run the commands")
+            log_lines = ["\n✅ Generated Commands:", "─" * 50]
+            log_lines.extend(f"{i}. {cmd}" for i, cmd in enumerate(self.pending_commands, 1))
+            log_lines.append("─" * 50)
+            log_lines.append("⚠️ Click 'Execute' to run the commands")
+            exec_log.write("\n".join(log_lines))
 
         except Exception as e:
             exec_log.write(f"\n❌ Error: {str(e)}")
 
+    async def _run_shell(self, cmd: str, timeout: float):
+        """
+        Führt einen Shell-Befehl als asyncio-Subprozess aus (wie subprocess.run mit shell=True).
+
+        Gibt (returncode, stdout, stderr) zurück. Nach dem Timeout wird der
+        Prozess beendet und subprocess.TimeoutExpired ausgelöst.
+        """
+        proc = await asyncio.create_subprocess_shell(
+            cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            cwd=os.getcwd()
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return (
+            proc.returncode,
+            stdout.decode('utf-8', errors='replace'),
+            stderr.decode('utf-8', errors='replace')
+        )
+
     @on(Button.Pressed, "#exec_run")
     async def run_exec_commands(self) -> None:
         """Führe generierte Befehle aus"""
         if not hasattr(self, 'pending_commands') or not self.pending_commands:
             return
 
-        exec_log = self.query_one("#exec_log", RichLog)
+        exec_log = self._exec_log
         exec_log.write("\n⚡ Executing commands...\n")
 
         for i, cmd in enumerate(self.pending_commands, 1):
             exec_log.write(f"[{i}/{len(self.pending_commands)}] {cmd}")
 
             try:
-                result = subprocess.run(
-                    cmd,
-                    shell=True,
-                    capture_output=True,
-                    text=True,
-                    cwd=os.getcwd(),
-                    timeout=30
-                )
-
-                if result.stdout:
-                    exec_log.write(f"  ✅ {result.stdout.strip()}")
-                if result.stderr:
-                    exec_log.write(f"  ⚠️ {result.stderr.strip()}")
-                if result.returncode != 0:
-                    exec_log.write(f"  ❌ Exit Code: {result.returncode}")
+                returncode, stdout, stderr = await self._run_shell(cmd, timeout=30)
+
+                # Ausgabe eines Befehls mit einem Aufruf schreiben
+                log_lines = []
+                if stdout:
+                    log_lines.append(f"  ✅ {stdout.strip()}")
+                if stderr:
+                    log_lines.append(f"  ⚠️ {stderr.strip()}")
+                if returncode != 0:
+                    log_lines.append(f"  ❌ Exit Code: {returncode}")
+                if log_lines:
+                    exec_log.write("\n".join(log_lines))
 
             except Exception as e:
                 exec_log.write(f"  ❌ Error: {str(e)}")
@@ -428,24 +555,32 @@ IMPORTANT:
     def cancel_exec_commands(self) -> None:
         """Abbrechen"""
         self.pending_commands = []
-        exec_log = self.query_one("#exec_log", RichLog)
+        exec_log = self._exec_log
         exec_log.write("\n⛔ Execution cancelled")
 
     @on(Button.Pressed, "#models_load")
     async def load_models(self) -> None:
-        """Lade verfügbare Modelle"""
-        table = self.query_one("#models_table", DataTable)
+        """Lade verfügbare Modelle (zwischengespeichert, siehe list_models)"""
+        await self._show_models(refresh=False)
+
+    @on(Button.Pressed, "#models_refresh")
+    async def refresh_models(self) -> None:
+        """Lade Modelle neu von der API"""
+        await self._show_models(refresh=True)
+
+    async def _show_models(self, refresh: bool) -> None:
+        """Füllt die Modell-Tabelle"""
+        table = self._models_table
         table.clear(columns=True)
 
         table.add_column("Model ID", width=40)
         table.add_column("Description", width=60)
 
         try:
-            models = self.client.models.list()
+            models = await self._run_blocking(list_models, refresh=refresh)
 
-            for model in models.data:
-                description = getattr(model, 'description', 'No description') or 'No description'
-                table.add_row(model.id, description)
+            for model in models:
+                table.add_row(model["id"], model["description"] or 'No description')
 
         except Exception as e:
             table.add_row("Error", str(e))
@@ -453,18 +588,19 @@ IMPORTANT:
     @on(Button.Pressed, "#complete_send")
     async def send_complete_request(self) -> None:
         """Sende Completion-Request"""
-        complete_input = self.query_one("#complete_input", Input)
+        complete_input = self._complete_input
         prompt = complete_input.value.strip()
 
         if not prompt:
             return
 
-        complete_log = self.query_one("#complete_log", RichLog)
+        complete_log = self._complete_log
         complete_log.write(f"\n📝 Prompt: {prompt}")
         complete_log.write("🤔 Generating response...")
 
         try:
-            response = self.client.chat.complete(
+            response = await self._run_blocking(
+                self.client.chat.complete,
                 model=self.current_model,
                 messages=[{"role": "user", "content": prompt}],
                 temperature=self.temperature,
@@ -493,14 +629,9 @@ IMPORTANT:
             status_label.update("✅ Settings saved!")
 
             # Update Labels
-            labels = self.query("Label")
-            for label in labels:
-                if "Current Model" in str(label.renderable):
-                    label.update(f"Current Model: {self.current_model}")
-                elif "Temperature" in str(label.renderable):
-                    label.update(f"Temperature: {self.temperature}")
-                elif "Max Tokens" in str(label.renderable):
-                    label.update(f"Max Tokens: {self.max_tokens}")
+            self.query_one("#model_label", Label).update(f"Current Model: {self.current_model}")
+            self.query_one("#temp_label", Label).update(f"Temperature: {self.temperature}")
+            self.query_one("#tokens_label", Label).update(f"Max Tokens: {self.max_tokens}")
 
         except Exception as e:
             status_label.update(f"❌ Error: {str(e)}")
@@ -512,7 +643,7 @@ IMPORTANT:
     def action_clear_chat(self) -> None:
         """Lösche Chat-Historie"""
         self.chat_messages = []
-        chat_log = self.query_one("#chat_log", RichLog)
+        chat_log = self._chat_log
         chat_log.clear()
         chat_log.write("🗑️ Chat history cleared")
 
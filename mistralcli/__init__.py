@@ -31,12 +31,17 @@ def reset_client():
     from .core import reset_client as _reset_client
     return _reset_client()
 
+def list_models(*args, **kwargs):
+    from .core import list_models as _list_models
+    return _list_models(*args, **kwargs)
+
 __all__ = [
     # Version
     '__version__',
     # Client
     'get_client',
     'reset_client',
+    'list_models',
     # Logging
     'logger',
     'setup_logging',
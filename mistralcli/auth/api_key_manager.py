@@ -7,8 +7,11 @@ Version: 1.5.2
 """
 
 import os
+import hmac
+import hashlib
 import getpass
 import secrets
+from functools import lru_cache
 from typing import Optional, Tuple, Dict, Any
 from pathlib import Path
 
@@ -37,9 +40,16 @@ if CRYPTO_AVAILABLE:
 # AES Encryption (Fallback)
 # ============================================================================
 
+# Derived keys for this process, so PBKDF2 runs once per password and salt.
+# The password is only kept as HMAC under a random per-process key, never
+# as a plain (or plainly hashed) value.
+_derived_keys: Dict[Tuple[bytes, bytes], bytes] = {}
+_password_pepper = secrets.token_bytes(32)
+
+
 def _derive_key_from_password(password: str, salt: bytes) -> bytes:
     """
-    Derives an AES key from a password (PBKDF2).
+    Derives an AES key from a password (PBKDF2, cached per process).
 
     Args:
         password: The master password
@@ -51,6 +61,11 @@ def _derive_key_from_password(password: str, salt: bytes) -> bytes:
     if not CRYPTO_AVAILABLE:
         raise RuntimeError("cryptography not installed")
 
+    cache_key = (hmac.new(_password_pepper, password.encode(), hashlib.sha256).digest(), salt)
+    key = _derived_keys.get(cache_key)
+    if key is not None:
+        return key
+
     kdf = PBKDF2HMAC(
         algorithm=hashes.SHA256(),
         length=32,
@@ -58,13 +73,18 @@ def _derive_key_from_password(password: str, salt: bytes) -> bytes:
         iterations=480000,  # OWASP recommendation for 2023+
     )
     key = base64.urlsafe_b64encode(kdf.derive(password.encode()))
+    _derived_keys[cache_key] = key
     return key
 
 
+@lru_cache(maxsize=1)
 def _get_or_create_salt() -> bytes:
     """
     Reads or creates a salt for key derivation.
 
+    The salt is read once per process; delete_stored_api_key clears the
+    cached value together with the file.
+
     Returns:
         16-byte salt
     """
@@ -222,6 +242,8 @@ def delete_stored_api_key() -> Tuple[bool, str]:
             deleted.append("salt")
         except Exception:
             pass
+    _get_or_create_salt.cache_clear()
+    _derived_keys.clear()
 
     if deleted:
         logger.info(f"API key deleted from: {', '.join(deleted)}")
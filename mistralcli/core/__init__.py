@@ -18,10 +18,15 @@ def reset_client():
     from .client import reset_client as _reset_client
     return _reset_client()
 
+def list_models(*args, **kwargs):
+    from .client import list_models as _list_models
+    return _list_models(*args, **kwargs)
+
 __all__ = [
     # Client
     'get_client',
     'reset_client',
+    'list_models',
     # Logging
     'logger',
     'setup_logging',
@@ -8,11 +8,15 @@ Version: 1.5.2
 
 import os
 import sys
-from typing import Optional
+import time
+import hashlib
+from typing import Dict, List, Optional
 from mistralai import Mistral
 
+from .config import YES_ANSWERS, MODELS_CACHE_FILE, MODELS_CACHE_TTL
 from .logging_config import logger
 from ..auth.api_key_manager import get_stored_api_key, setup_api_key_interactive
+from ..utils.serialization import json_loads, json_dumps
 
 
 # ============================================================================
@@ -21,6 +25,9 @@ from ..auth.api_key_manager import get_stored_api_key, setup_api_key_interactive
 
 _client_instance: Optional[Mistral] = None
 
+# Identifies the API-Key of the singleton (for the model list cache)
+_client_key_id: Optional[str] = None
+
 
 def get_client(api_key: Optional[str] = None) -> Mistral:
     """
@@ -42,7 +49,7 @@ def get_client(api_key: Optional[str] = None) -> Mistral:
     Raises:
         SystemExit: When no API-Key is available
     """
-    global _client_instance
+    global _client_instance, _client_key_id
 
     # If already initialized and no new key, use existing instance
     if _client_instance is not None and api_key is None:
@@ -63,7 +70,7 @@ def get_client(api_key: Optional[str] = None) -> Mistral:
 
         try:
             response = input("Do you want to set up an API-Key now? [Y/n]: ").strip().lower()
-            if response in ['', 'j', 'ja', 'y', 'yes']:
+            if not response or response in YES_ANSWERS:
                 if setup_api_key_interactive():
                     key = get_stored_api_key()
         except (EOFError, KeyboardInterrupt):
@@ -96,6 +103,7 @@ def get_client(api_key: Optional[str] = None) -> Mistral:
         # Store instance only if no explicit key was passed
         if api_key is None:
             _client_instance = client
+            _client_key_id = hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
 
         return client
 
@@ -107,6 +115,69 @@ def get_client(api_key: Optional[str] = None) -> Mistral:
 
 def reset_client() -> None:
     """Resets the client (for tests or reconfiguration)."""
-    global _client_instance
+    global _client_instance, _client_key_id
     _client_instance = None
+    _client_key_id = None
     logger.debug("Client instance reset")
+
+
+# ============================================================================
+# Model List
+# ============================================================================
+
+def _read_models_cache(key_id: str) -> Optional[List[Dict[str, str]]]:
+    """Returns the cached model list if it is fresh and belongs to the key."""
+    try:
+        with open(MODELS_CACHE_FILE, encoding="utf-8") as f:
+            cached = json_loads(f.read())
+        if cached["key"] == key_id and time.time() - cached["time"] < MODELS_CACHE_TTL:
+            return cached["models"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return None
+
+
+def _write_models_cache(key_id: str, models: List[Dict[str, str]]) -> None:
+    """Stores the model list; a failed write only costs the next request."""
+    tmp_path = f"{MODELS_CACHE_FILE}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(json_dumps({"key": key_id, "time": time.time(), "models": models}))
+        os.replace(tmp_path, MODELS_CACHE_FILE)
+    except OSError as e:
+        logger.debug("Model list cache not written: %s", e)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def list_models(refresh: bool = False) -> List[Dict[str, str]]:
+    """
+    Returns the available models as dicts with "id" and "description".
+
+    The list is cached on disk for MODELS_CACHE_TTL seconds per API-Key,
+    so repeated calls (also across sessions) skip the API request.
+
+    Args:
+        refresh: Ignore the cached list and fetch it again
+
+    Returns:
+        List of models
+    """
+    client = get_client()
+    key_id = _client_key_id or ""
+
+    if not refresh:
+        cached = _read_models_cache(key_id)
+        if cached is not None:
+            logger.debug("Model list served from cache")
+            return cached
+
+    response = client.models.list()
+    models = [
+        {"id": model.id, "description": getattr(model, "description", None) or ""}
+        for model in response.data
+    ]
+    _write_models_cache(key_id, models)
+    return models
@@ -36,6 +36,13 @@ try:
 except ImportError:
     CRYPTO_AVAILABLE = False
 
+# Try to load orjson (optional, faster JSON serialization)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 # ============================================================================
 # General Constants
@@ -49,12 +56,24 @@ DEFAULT_TIMEOUT = 30
 # Log file in home directory
 LOG_FILE = Path.home() / ".mistral-cli.log"
 
+# Persistent fetch_url cache (conditional GET, needs diskcache)
+URL_CACHE_DIR = Path.home() / ".mistral-cli-urlcache"
+URL_CACHE_SIZE_LIMIT = 64 * 1024 * 1024  # 64 MB
+
+# Cached model list (list_models), valid for MODELS_CACHE_TTL seconds
+MODELS_CACHE_FILE = Path.home() / ".mistral-cli-models.json"
+MODELS_CACHE_TTL = 600
+
 # Secure storage constants
 KEYRING_SERVICE = "mistral-cli"
 KEYRING_USERNAME = "api_key"
 ENCRYPTED_KEY_FILE = Path.home() / ".mistral-cli-key.enc"
 SALT_FILE = Path.home() / ".mistral-cli-salt"
 
+# Accepted answers for confirmation prompts (English and German)
+YES_ANSWERS = frozenset({'y', 'yes', 'j', 'ja'})
+NO_ANSWERS = frozenset({'n', 'no', 'nein'})
+
 
 # ============================================================================
 # Security Constants
@@ -74,7 +93,7 @@ class RiskLevel(Enum):
 # ============================================================================
 
 # Categories of dangerous commands
-DANGEROUS_COMMANDS = {
+DANGEROUS_COMMANDS = frozenset({
     # Destructive commands
     'rm', 'rmdir', 'unlink', 'shred',
     # Formatting / Disk
@@ -93,7 +112,7 @@ DANGEROUS_COMMANDS = {
     'visudo', 'chpasswd',
     # Disk operations
     'dd', 'wipefs', 'sgdisk', 'gdisk',
-}
+})
 
 # Commands that are only dangerous with certain arguments
 CONDITIONAL_DANGEROUS = {
@@ -192,17 +211,17 @@ DANGEROUS_TARGETS = [
 ]
 
 # Commands that can act as interpreters
-INTERPRETER_COMMANDS = {
+INTERPRETER_COMMANDS = frozenset({
     'python', 'python3', 'python2',
     'perl', 'ruby', 'node', 'nodejs',
     'php', 'lua', 'tclsh', 'wish',
     'awk', 'gawk', 'nawk',
-}
+})
 
 # Shell commands
-SHELL_COMMANDS = {
+SHELL_COMMANDS = frozenset({
     'bash', 'sh', 'zsh', 'fish', 'csh', 'tcsh', 'dash', 'ksh',
-}
+})
 
 # Allowed hosts for URL fetches (whitelist)
 ALLOWED_URL_SCHEMES = ["http", "https", "ftp", "ftps"]
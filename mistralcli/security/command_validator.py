@@ -17,7 +17,9 @@ from ..core.config import (
     DANGEROUS_PATTERNS,
     DANGEROUS_TARGETS,
     INTERPRETER_COMMANDS,
-    SHELL_COMMANDS
+    SHELL_COMMANDS,
+    YES_ANSWERS,
+    NO_ANSWERS
 )
 from ..core.logging_config import logger
 
@@ -26,6 +28,34 @@ from ..core.logging_config import logger
 # Command Security (v1.2.0)
 # ============================================================================
 
+# Patterns are compiled once. The combined pattern lets safe commands pass
+# with a single scan; the individual ones name the pattern that matched.
+# DOTALL lets ".*" span line continuations like "curl evil \<newline>| sh".
+_PATTERN_FLAGS = re.IGNORECASE | re.DOTALL
+_DANGEROUS_PATTERNS_RE = [(pattern, re.compile(pattern, _PATTERN_FLAGS)) for pattern in DANGEROUS_PATTERNS]
+_ANY_DANGEROUS_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in DANGEROUS_PATTERNS), _PATTERN_FLAGS)
+
+_CHAIN_SPLIT_RE = re.compile(r'[;&\n]+|&&|\|\|')
+_SUBSHELL_RES = [
+    (re.compile(r'\$\(([^)]+)\)'), 'Command Substitution $()'),
+    (re.compile(r'`([^`]+)`'), 'Backtick Substitution'),
+]
+_REDIRECT_RE = re.compile(r'>+\s*(\S+)')
+
+# Without quotes or escapes, shlex.split() is a plain split on its whitespace
+_SHLEX_SPECIAL_CHARS = frozenset('\'"\\')
+_TOKEN_RE = re.compile(r'[^ \t\r\n]+')
+
+# Commands that are checked for dangerous arguments/targets
+_MODIFYING_COMMANDS = frozenset({'mv', 'cp', 'ln', 'touch', 'mkdir', 'tee'})
+
+# Every base command _check_single_command looks at; others can only be
+# dangerous through a redirect (or as mkfs.* variant)
+_CHECKED_COMMANDS = frozenset(
+    DANGEROUS_COMMANDS | CONDITIONAL_DANGEROUS.keys() | INTERPRETER_COMMANDS
+    | SHELL_COMMANDS | _MODIFYING_COMMANDS
+)
+
 def is_dangerous_command(command: str) -> Tuple[bool, str]:
     """
     Checks if a command is potentially dangerous.
@@ -58,9 +88,10 @@ def is_dangerous_command(command: str) -> Tuple[bool, str]:
     command = command.strip()
 
     # 1. Pattern-based detection (fastest check first)
-    for pattern in DANGEROUS_PATTERNS:
-        if re.search(pattern, command, re.IGNORECASE):
-            return True, f"Dangerous pattern detected: {pattern[:30]}..."
+    if _ANY_DANGEROUS_RE.search(command):
+        for pattern, pattern_re in _DANGEROUS_PATTERNS_RE:
+            if pattern_re.search(command):
+                return True, f"Dangerous pattern detected: {pattern[:30]}..."
 
     # 2. Detect command chaining and check each part
     chain_separators = [';', '&&', '||', '\n']
@@ -71,7 +102,7 @@ def is_dangerous_command(command: str) -> Tuple[bool, str]:
 
     if has_chaining:
         # Split by separators
-        parts = re.split(r'[;&\n]+|&&|\|\|', command)
+        parts = _CHAIN_SPLIT_RE.split(command)
         for part in parts:
             part = part.strip()
             if part:
@@ -80,12 +111,8 @@ def is_dangerous_command(command: str) -> Tuple[bool, str]:
                     return True, f"Dangerous command in chain: {reason}"
 
     # 3. Subshell detection (recursive)
-    subshell_patterns = [
-        (r'\$\(([^)]+)\)', 'Command Substitution $()'),
-        (r'`([^`]+)`', 'Backtick Substitution'),
-    ]
-    for pattern, subshell_type in subshell_patterns:
-        matches = re.findall(pattern, command)
+    for pattern_re, subshell_type in _SUBSHELL_RES:
+        matches = pattern_re.findall(command)
         for match in matches:
             is_dangerous, reason = is_dangerous_command(match)
             if is_dangerous:
@@ -123,13 +150,17 @@ def _check_single_command(command: str) -> Tuple[bool, str]:
     if not command:
         return False, ""
 
-    try:
-        # Safe parsing with shlex
-        tokens = shlex.split(command)
-    except ValueError as e:
-        # Invalid quoting could indicate manipulation
-        logger.warning(f"Invalid shell quoting in command: {command} ({e})")
-        return True, f"Invalid shell quoting: {e}"
+    if _SHLEX_SPECIAL_CHARS.isdisjoint(command):
+        # Nothing to unquote - same tokens as shlex.split, without its lexer
+        tokens = _TOKEN_RE.findall(command)
+    else:
+        try:
+            # Safe parsing with shlex
+            tokens = shlex.split(command)
+        except ValueError as e:
+            # Invalid quoting could indicate manipulation
+            logger.warning(f"Invalid shell quoting in command: {command} ({e})")
+            return True, f"Invalid shell quoting: {e}"
 
     if not tokens:
         return False, ""
@@ -142,6 +173,10 @@ def _check_single_command(command: str) -> Tuple[bool, str]:
     if base_cmd.startswith('mkfs'):
         return True, f"Filesystem formatting: {base_cmd}"
 
+    # Common case: an unchecked command without redirect needs no further checks
+    if base_cmd not in _CHECKED_COMMANDS and '>' not in command:
+        return False, ""
+
     # 1. Interpreter with code execution
     if base_cmd in INTERPRETER_COMMANDS:
         code_exec_flags = ['-c', '-e', '--eval', '-exec']
@@ -189,8 +224,7 @@ def _check_single_command(command: str) -> Tuple[bool, str]:
                 return True, f"{base_cmd} with dangerous arguments: {arg}"
 
     # 5. Check dangerous targets (for modifying commands)
-    modifying_commands = {'mv', 'cp', 'ln', 'touch', 'mkdir', 'tee'}
-    if base_cmd in modifying_commands:
+    if base_cmd in _MODIFYING_COMMANDS:
         for arg in args:
             if arg.startswith('-'):
                 continue  # Skip flags
@@ -200,7 +234,7 @@ def _check_single_command(command: str) -> Tuple[bool, str]:
 
     # 6. Redirect to dangerous targets (already in patterns, but for safety)
     if '>' in command:
-        redirect_match = re.search(r'>+\s*(\S+)', command)
+        redirect_match = _REDIRECT_RE.search(command)
         if redirect_match:
             redirect_target = redirect_match.group(1)
             for target in DANGEROUS_TARGETS:
@@ -237,11 +271,11 @@ def request_confirmation(command: str, reason: str) -> bool:
         try:
             response = input("Do you want to execute this command anyway? [y/N]: ").strip().lower()
 
-            if response in ['j', 'ja', 'y', 'yes']:
+            if response in YES_ANSWERS:
                 logger.info(f"User confirmed dangerous command: {command}")
                 return True
 
-            if response in ['n', 'nein', 'no', '']:
+            if not response or response in NO_ANSWERS:
                 logger.info(f"User rejected dangerous command: {command}")
                 return False
 
@@ -14,6 +14,10 @@ from typing import Optional, Tuple
 # Path Validation (v1.2.0)
 # ============================================================================
 
+# Absolute paths to sensitive areas
+_SENSITIVE_PREFIXES = ('/etc', '/usr', '/var', '/boot', '/root', '/dev', '/proc', '/sys')
+
+
 def is_safe_path(path: str, base_dir: Optional[str] = None) -> Tuple[bool, str]:
     """
     Checks if a path is safe (no path traversal attack).
@@ -32,9 +36,6 @@ def is_safe_path(path: str, base_dir: Optional[str] = None) -> Tuple[bool, str]:
     if '..' in path:
         return False, "Path traversal detected (..)"
 
-    # Absolute paths to sensitive areas
-    sensitive_prefixes = ['/etc', '/usr', '/var', '/boot', '/root', '/dev', '/proc', '/sys']
-
     try:
         # Normalize path
         normalized = os.path.normpath(path)
@@ -52,9 +53,9 @@ def is_safe_path(path: str, base_dir: Optional[str] = None) -> Tuple[bool, str]:
         # Without base dir: check sensitive areas
         abs_path = os.path.abspath(os.path.expanduser(normalized))
 
-        for prefix in sensitive_prefixes:
-            if abs_path.startswith(prefix):
-                return False, f"Access to sensitive area: {prefix}"
+        if abs_path.startswith(_SENSITIVE_PREFIXES):
+            prefix = next(p for p in _SENSITIVE_PREFIXES if abs_path.startswith(p))
+            return False, f"Access to sensitive area: {prefix}"
 
         return True, abs_path
 
@@ -18,6 +18,18 @@ from ..core.logging_config import logger
 # URL Validation
 # ============================================================================
 
+# Private ranges parsed once, per IP version (an address is only compared
+# with networks of its own version)
+_PRIVATE_NETWORKS = {
+    version: tuple(
+        network
+        for network in (ipaddress.ip_network(r, strict=False) for r in PRIVATE_IP_RANGES)
+        if network.version == version
+    )
+    for version in (4, 6)
+}
+
+
 def validate_url(url: str) -> Tuple[bool, str]:
     """
     Validates a URL for security.
@@ -45,8 +57,8 @@ def validate_url(url: str) -> Tuple[bool, str]:
             # Try to parse as IP
             try:
                 ip = ipaddress.ip_address(hostname)
-                for private_range in PRIVATE_IP_RANGES:
-                    if ip in ipaddress.ip_network(private_range, strict=False):
+                for private_network in _PRIVATE_NETWORKS[ip.version]:
+                    if ip in private_network:
                         logger.warning(f"URL to private/local IP blocked: {url}")
                         return (False, f"Access to private/local IP address not allowed: {hostname}")
             except ValueError:
@@ -58,7 +70,7 @@ def validate_url(url: str) -> Tuple[bool, str]:
             if any(lh in hostname.lower() for lh in localhost_patterns):
                 return (False, "Access to localhost not allowed")
 
-        logger.debug(f"URL validated: {url}")
+        logger.debug("URL validated: %s", url)
         return (True, "URL is safe")
 
     except Exception as e:
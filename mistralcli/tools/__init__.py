@@ -7,13 +7,13 @@ Version: 1.5.2
 """
 
 # Tool Definitions
-from .definitions import TOOLS
+from .definitions import TOOLS, TOOLS_BY_NAME
 
 # Tool Executor
-from .executor import execute_tool
+from .executor import execute_tool, execute_tools_batch, reset_caches
 
 # System Tools
-from .system import execute_bash_command
+from .system import execute_bash_command, set_confirmation_handler
 
 # Filesystem Tools
 from .filesystem import (
@@ -50,9 +50,13 @@ from .image import get_image_info
 __all__ = [
     # Definitions & Executor
     'TOOLS',
+    'TOOLS_BY_NAME',
     'execute_tool',
+    'execute_tools_batch',
+    'reset_caches',
     # System
     'execute_bash_command',
+    'set_confirmation_handler',
     # Filesystem
     'read_file',
     'write_file',
@@ -9,18 +9,34 @@ Version: 1.5.2
 import os
 import json
 import csv
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 
 from ..core.logging_config import logger
 from ..security.path_validator import validate_path
 from ..security.sanitizers import sanitize_path
+from ..utils.helpers import FileCacheKey, file_cache_key
+from ..utils.serialization import json_loads
 from .system import _create_result
 
 
+# Maximum number of CSV rows returned as data
+MAX_CSV_ROWS = 10_000
+
+# Number of unchanged CSV files kept parsed in memory
+CSV_CACHE_SIZE = 8
+
+
 # ============================================================================
 # JSON Processing
 # ============================================================================
 
+@lru_cache(maxsize=128)
+def _compile_query(query: str) -> Tuple[Tuple[str, Optional[int]], ...]:
+    """Splits a dotted query into (key, list index) steps (cached)."""
+    return tuple((key, int(key) if key.isdigit() else None) for key in query.split('.'))
+
+
 def parse_json(json_string: str, query: Optional[str] = None) -> Dict[str, Any]:
     """Parses JSON data."""
     logger.info(f"Parsing JSON, Query: {query}")
@@ -34,18 +50,20 @@ def parse_json(json_string: str, query: Optional[str] = None) -> Dict[str, Any]:
         return _create_result(success=False, error="JSON too large (max. 1 MB)")
 
     try:
-        data = json.loads(json_string)
+        data = json_loads(json_string)
 
         # If a query is provided, try to extract the value
         if query:
-            keys = query.split('.')
             result = data
-            for key in keys:
-                if isinstance(result, dict):
-                    result = result.get(key)
-                elif isinstance(result, list) and key.isdigit():
-                    result = result[int(key)]
-                else:
+            for key, index in _compile_query(query):
+                try:
+                    if isinstance(result, dict):
+                        result = result[key]
+                    elif isinstance(result, list) and index is not None:
+                        result = result[index]
+                    else:
+                        raise KeyError(key)
+                except (KeyError, IndexError):
                     logger.warning(f"Key not found: {key}")
                     return _create_result(success=False, error=f"Key '{key}' not found")
 
@@ -65,6 +83,94 @@ def parse_json(json_string: str, query: Optional[str] = None) -> Dict[str, Any]:
 # CSV Processing
 # ============================================================================
 
+CsvRows = Tuple[List[Dict[Optional[str], Any]], int, List[str]]
+
+
+def _read_csv_rows(path: str, delimiter: str) -> CsvRows:
+    """Reads CSV rows with the csv module; returns (rows, total rows, columns)."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f, delimiter=delimiter)
+        columns = next(reader, [])
+        num_columns = len(columns)
+
+        rows = []
+        for row in reader:
+            if not row:
+                continue  # Skip blank lines (like csv.DictReader)
+            if len(rows) == MAX_CSV_ROWS:
+                num_rows = MAX_CSV_ROWS + 1
+                break
+
+            record = dict(zip(columns, row))
+            if len(row) < num_columns:
+                for column in columns[len(row):]:
+                    record[column] = None
+            elif len(row) > num_columns:
+                record[None] = row[num_columns:]
+            rows.append(record)
+        else:
+            num_rows = len(rows)
+
+        # Count the remaining rows without building dicts
+        num_rows += sum(1 for row in reader if row)
+
+    return rows, num_rows, columns
+
+
+def _read_csv_arrow(path: str, delimiter: str) -> Optional[CsvRows]:
+    """
+    Reads CSV rows with pyarrow's C parser, if installed.
+
+    All values are read as strings, like the csv module. Returns None for
+    files pyarrow can't represent the same way (ragged rows, duplicate
+    column names, empty files), so the caller can fall back.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return None
+
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        columns = next(csv.reader(f, delimiter=delimiter), [])
+    if not columns or len(set(columns)) != len(columns):
+        return None
+
+    try:
+        table = pa_csv.read_csv(
+            path,
+            parse_options=pa_csv.ParseOptions(delimiter=delimiter, newlines_in_values=True),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={column: pa.string() for column in columns},
+                strings_can_be_null=False,
+                quoted_strings_can_be_null=False,
+            ),
+        )
+    except pa.ArrowInvalid:
+        return None
+
+    rows = table.slice(0, MAX_CSV_ROWS).to_pylist()
+    return rows, table.num_rows, columns
+
+
+def _read_csv(path: str, delimiter: str) -> CsvRows:
+    """Reads CSV rows with pyarrow if possible, else with the csv module."""
+    parsed = _read_csv_arrow(path, delimiter)
+    if parsed is None:
+        parsed = _read_csv_rows(path, delimiter)
+    return parsed
+
+
+@lru_cache(maxsize=CSV_CACHE_SIZE)
+def _read_csv_cached(key: FileCacheKey, delimiter: str) -> CsvRows:
+    """
+    _read_csv for files that have not changed since (see file_cache_key).
+
+    The returned rows are shared between calls and must not be modified.
+    """
+    return _read_csv(key[0], delimiter)
+
+
 def parse_csv(file_path: str, delimiter: str = ",") -> Dict[str, Any]:
     """Reads and parses CSV data with path validation."""
     logger.info(f"Parsing CSV: {file_path}")
@@ -86,16 +192,21 @@ def parse_csv(file_path: str, delimiter: str = ",") -> Dict[str, Any]:
         if file_size > 10_000_000:  # 10 MB
             return _create_result(success=False, error="CSV too large (max. 10 MB)")
 
-        with open(path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f, delimiter=delimiter)
-            rows = list(reader)
+        # Repeated parses of an unchanged file are served from memory
+        key = file_cache_key(path)
+        if key is not None:
+            rows, num_rows, columns = _read_csv_cached(key, delimiter)
+        else:
+            rows, num_rows, columns = _read_csv(path, delimiter)
 
-        logger.info(f"CSV read: {len(rows)} rows")
+        truncated = num_rows > len(rows)
+        logger.info(f"CSV read: {num_rows} rows" + (f" ({len(rows)} returned)" if truncated else ""))
         return _create_result(
             success=True,
             data=rows,
-            num_rows=len(rows),
-            columns=list(rows[0].keys()) if rows else []
+            num_rows=num_rows,
+            columns=columns,
+            truncated=truncated
         )
     except FileNotFoundError:
         logger.error(f"CSV not found: {file_path}")
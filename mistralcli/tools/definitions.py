@@ -6,334 +6,180 @@ Definitions of all 14 tools for Function Calling
 Version: 1.5.2
 """
 
-from typing import List, Dict, Any
+from typing import Dict, Any, List, Tuple
 
 
 # ============================================================================
-# Tool Definitions for Function Calling
+# Schema Helpers
 # ============================================================================
 
-TOOLS: List[Dict[str, Any]] = [
-    {
-        "type": "function",
-        "function": {
-            "name": "execute_bash_command",
-            "description": "Executes a Bash command on the system. Use this to create files, create folders, run programs, etc. NOTE: Dangerous commands are automatically blocked.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "command": {
-                        "type": "string",
-                        "description": "The Bash command to execute"
-                    },
-                    "explanation": {
-                        "type": "string",
-                        "description": "A brief explanation of what the command does"
-                    }
-                },
-                "required": ["command", "explanation"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "read_file",
-            "description": "Reads the contents of a file. NOTE: Access to system files is restricted.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "The path to the file"
-                    }
-                },
-                "required": ["file_path"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "write_file",
-            "description": "Writes content to a file (creates or overwrites). NOTE: Writing to system directories is not allowed.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "The path to the file"
-                    },
-                    "content": {
-                        "type": "string",
-                        "description": "The content to write to the file"
-                    }
-                },
-                "required": ["file_path", "content"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "fetch_url",
-            "description": "Retrieves the content of a URL (websites, APIs, etc.). Returns HTML, JSON or text. NOTE: Local/private IP addresses are blocked.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "The complete URL (with http:// or https://)"
-                    },
-                    "method": {
-                        "type": "string",
-                        "description": "HTTP method (GET or POST)",
-                        "enum": ["GET", "POST"]
-                    }
-                },
-                "required": ["url"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "download_file",
-            "description": "Downloads a file from a URL and saves it locally. NOTE: Downloads from local/private IPs are blocked.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "url": {
-                        "type": "string",
-                        "description": "The URL of the file to download"
-                    },
-                    "destination": {
-                        "type": "string",
-                        "description": "The local path where the file should be saved"
-                    }
-                },
-                "required": ["url", "destination"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "search_web",
-            "description": "Searches the internet for information. Returns a list of search results.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "query": {
-                        "type": "string",
-                        "description": "The search query"
-                    },
-                    "num_results": {
-                        "type": "integer",
-                        "description": "Number of desired results (default: 5, maximum: 10)",
-                        "default": 5
-                    }
-                },
-                "required": ["query"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "rename_file",
-            "description": "Renames a file or folder",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "old_path": {
-                        "type": "string",
-                        "description": "The current path of the file/folder"
-                    },
-                    "new_path": {
-                        "type": "string",
-                        "description": "The new path/name"
-                    }
-                },
-                "required": ["old_path", "new_path"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "copy_file",
-            "description": "Copies a file or folder",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "source": {
-                        "type": "string",
-                        "description": "The source path"
-                    },
-                    "destination": {
-                        "type": "string",
-                        "description": "The destination path"
-                    }
-                },
-                "required": ["source", "destination"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "move_file",
-            "description": "Moves a file or folder",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "source": {
-                        "type": "string",
-                        "description": "The source path"
-                    },
-                    "destination": {
-                        "type": "string",
-                        "description": "The destination path"
-                    }
-                },
-                "required": ["source", "destination"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "parse_json",
-            "description": "Parses JSON data and extracts information",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "json_string": {
-                        "type": "string",
-                        "description": "The JSON string to parse"
-                    },
-                    "query": {
-                        "type": "string",
-                        "description": "Optional JSONPath or key to extract specific data"
-                    }
-                },
-                "required": ["json_string"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "parse_csv",
-            "description": "Reads and parses CSV data",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "file_path": {
-                        "type": "string",
-                        "description": "Path to the CSV file"
-                    },
-                    "delimiter": {
-                        "type": "string",
-                        "description": "Delimiter (default: comma)",
-                        "default": ","
-                    }
-                },
-                "required": ["file_path"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "upload_ftp",
-            "description": "Uploads a file to a server via FTP. NOTE: Use environment variables FTP_USER and FTP_PASS for credentials.",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "local_file": {
-                        "type": "string",
-                        "description": "Path to the local file"
-                    },
-                    "host": {
-                        "type": "string",
-                        "description": "FTP server host"
-                    },
-                    "username": {
-                        "type": "string",
-                        "description": "FTP username (optional, uses FTP_USER env variable)"
-                    },
-                    "password": {
-                        "type": "string",
-                        "description": "FTP password (optional, uses FTP_PASS env variable)"
-                    },
-                    "remote_path": {
-                        "type": "string",
-                        "description": "Destination path on the FTP server"
-                    }
-                },
-                "required": ["local_file", "host", "remote_path"]
-            }
-        }
-    },
-    {
-        "type": "function",
-        "function": {
-            "name": "get_image_info",
-            "description": "Analyzes an image and returns information (format, size, dimensions)",
-            "parameters": {
-                "type": "object",
-                "properties": {
-                    "image_path": {
-                        "type": "string",
-                        "description": "Path to the image"
-                    }
-                },
-                "required": ["image_path"]
-            }
-        }
-    },
-    {
+def _param(description: str, param_type: str = "string", **extra: Any) -> Dict[str, Any]:
+    """Builds a parameter schema (type, description, optional enum/default)."""
+    return {"type": param_type, "description": description, **extra}
+
+
+def _tool(
+    name: str,
+    description: str,
+    properties: Dict[str, Dict[str, Any]],
+    required: List[str]
+) -> Dict[str, Any]:
+    """Builds a function tool definition."""
+    return {
         "type": "function",
         "function": {
-            "name": "upload_sftp",
-            "description": "Uploads a file securely via SFTP (SSH File Transfer Protocol) to a server. Encrypted alternative to FTP. NOTE: Use environment variables SFTP_USER, SFTP_PASS or SFTP_KEY_PATH for credentials.",
+            "name": name,
+            "description": description,
             "parameters": {
                 "type": "object",
-                "properties": {
-                    "local_file": {
-                        "type": "string",
-                        "description": "Path to the local file"
-                    },
-                    "host": {
-                        "type": "string",
-                        "description": "SFTP server host"
-                    },
-                    "port": {
-                        "type": "integer",
-                        "description": "SFTP server port (default: 22)",
-                        "default": 22
-                    },
-                    "username": {
-                        "type": "string",
-                        "description": "SFTP username (optional, uses SFTP_USER env variable)"
-                    },
-                    "password": {
-                        "type": "string",
-                        "description": "SFTP password (optional, uses SFTP_PASS env variable)"
-                    },
-                    "key_path": {
-                        "type": "string",
-                        "description": "Path to SSH private key (optional, uses SFTP_KEY_PATH env variable)"
-                    },
-                    "remote_path": {
-                        "type": "string",
-                        "description": "Destination path on the SFTP server"
-                    }
-                },
-                "required": ["local_file", "host", "remote_path"]
+                "properties": properties,
+                "required": required
             }
         }
     }
-]
+
+
+# ============================================================================
+# Tool Definitions for Function Calling
+# ============================================================================
+
+# Tuple, so the shared definitions cannot be modified by accident
+TOOLS: Tuple[Dict[str, Any], ...] = (
+    _tool(
+        "execute_bash_command",
+        "Executes a Bash command on the system. Use this to create files, create folders, run programs, etc. NOTE: Dangerous commands are automatically blocked.",
+        {
+            "command": _param("The Bash command to execute"),
+            "explanation": _param("A brief explanation of what the command does"),
+        },
+        ["command", "explanation"]
+    ),
+    _tool(
+        "read_file",
+        "Reads the contents of a file. NOTE: Access to system files is restricted.",
+        {
+            "file_path": _param("The path to the file"),
+        },
+        ["file_path"]
+    ),
+    _tool(
+        "write_file",
+        "Writes content to a file (creates or overwrites). NOTE: Writing to system directories is not allowed.",
+        {
+            "file_path": _param("The path to the file"),
+            "content": _param("The content to write to the file"),
+        },
+        ["file_path", "content"]
+    ),
+    _tool(
+        "fetch_url",
+        "Retrieves the content of a URL (websites, APIs, etc.). Returns HTML, JSON or text. NOTE: Local/private IP addresses are blocked.",
+        {
+            "url": _param("The complete URL (with http:// or https://)"),
+            "method": _param("HTTP method (GET or POST)", enum=["GET", "POST"]),
+        },
+        ["url"]
+    ),
+    _tool(
+        "download_file",
+        "Downloads a file from a URL and saves it locally. NOTE: Downloads from local/private IPs are blocked.",
+        {
+            "url": _param("The URL of the file to download"),
+            "destination": _param("The local path where the file should be saved"),
+        },
+        ["url", "destination"]
+    ),
+    _tool(
+        "search_web",
+        "Searches the internet for information. Returns a list of search results.",
+        {
+            "query": _param("The search query"),
+            "num_results": _param("Number of desired results (default: 5, maximum: 10)", "integer", default=5),
+        },
+        ["query"]
+    ),
+    _tool(
+        "rename_file",
+        "Renames a file or folder",
+        {
+            "old_path": _param("The current path of the file/folder"),
+            "new_path": _param("The new path/name"),
+        },
+        ["old_path", "new_path"]
+    ),
+    _tool(
+        "copy_file",
+        "Copies a file or folder",
+        {
+            "source": _param("The source path"),
+            "destination": _param("The destination path"),
+        },
+        ["source", "destination"]
+    ),
+    _tool(
+        "move_file",
+        "Moves a file or folder",
+        {
+            "source": _param("The source path"),
+            "destination": _param("The destination path"),
+        },
+        ["source", "destination"]
+    ),
+    _tool(
+        "parse_json",
+        "Parses JSON data and extracts information",
+        {
+            "json_string": _param("The JSON string to parse"),
+            "query": _param("Optional JSONPath or key to extract specific data"),
+        },
+        ["json_string"]
+    ),
+    _tool(
+        "parse_csv",
+        "Reads and parses CSV data",
+        {
+            "file_path": _param("Path to the CSV file"),
+            "delimiter": _param("Delimiter (default: comma)", default=","),
+        },
+        ["file_path"]
+    ),
+    _tool(
+        "upload_ftp",
+        "Uploads a file to a server via FTP. NOTE: Use environment variables FTP_USER and FTP_PASS for credentials.",
+        {
+            "local_file": _param("Path to the local file"),
+            "host": _param("FTP server host"),
+            "username": _param("FTP username (optional, uses FTP_USER env variable)"),
+            "password": _param("FTP password (optional, uses FTP_PASS env variable)"),
+            "remote_path": _param("Destination path on the FTP server"),
+        },
+        ["local_file", "host", "remote_path"]
+    ),
+    _tool(
+        "get_image_info",
+        "Analyzes an image and returns information (format, size, dimensions)",
+        {
+            "image_path": _param("Path to the image"),
+        },
+        ["image_path"]
+    ),
+    _tool(
+        "upload_sftp",
+        "Uploads a file securely via SFTP (SSH File Transfer Protocol) to a server. Encrypted alternative to FTP. NOTE: Use environment variables SFTP_USER, SFTP_PASS or SFTP_KEY_PATH for credentials.",
+        {
+            "local_file": _param("Path to the local file"),
+            "host": _param("SFTP server host"),
+            "port": _param("SFTP server port (default: 22)", "integer", default=22),
+            "username": _param("SFTP username (optional, uses SFTP_USER env variable)"),
+            "password": _param("SFTP password (optional, uses SFTP_PASS env variable)"),
+            "key_path": _param("Path to SSH private key (optional, uses SFTP_KEY_PATH env variable)"),
+            "remote_path": _param("Destination path on the SFTP server"),
+        },
+        ["local_file", "host", "remote_path"]
+    ),
+)
+
+# Tool definitions by name
+TOOLS_BY_NAME: Dict[str, Dict[str, Any]] = {
+    tool["function"]["name"]: tool for tool in TOOLS
+}
@@ -6,15 +6,233 @@ Dispatcher for all 14 tools
 Version: 1.5.2
 """
 
-from typing import Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Callable, List, Optional, Sequence, Tuple
 
 from ..core.logging_config import logger
+from .definitions import TOOLS_BY_NAME
 from .system import execute_bash_command, _create_result
-from .filesystem import read_file, write_file, rename_file, copy_file, move_file
+from .filesystem import read_file, write_file, rename_file, copy_file, move_file, _read_text_cached
 from .network import fetch_url, download_file, search_web
 from .transfer import upload_ftp, upload_sftp
-from .data import parse_json, parse_csv
-from .image import get_image_info
+from .data import parse_json, parse_csv, _read_csv_cached
+from .image import get_image_info, _read_image_info_cached
+
+
+# ============================================================================
+# Tool Handlers
+# ============================================================================
+# Each handler maps the tool arguments from the model to the tool function.
+
+ToolHandler = Callable[[Dict[str, Any], bool], Dict[str, Any]]
+
+
+def _run_execute_bash_command(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return execute_bash_command(
+        args.get("command", ""),
+        args.get("explanation", ""),
+        auto_confirm
+    )
+
+
+def _run_read_file(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return read_file(args.get("file_path", ""))
+
+
+def _run_write_file(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return write_file(
+        args.get("file_path", ""),
+        args.get("content", ""),
+        auto_confirm
+    )
+
+
+def _run_fetch_url(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return fetch_url(
+        args.get("url", ""),
+        args.get("method", "GET")
+    )
+
+
+def _run_download_file(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return download_file(
+        args.get("url", ""),
+        args.get("destination", ""),
+        auto_confirm
+    )
+
+
+def _run_search_web(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return search_web(
+        args.get("query", ""),
+        args.get("num_results", 5)
+    )
+
+
+def _run_rename_file(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return rename_file(
+        args.get("old_path", ""),
+        args.get("new_path", ""),
+        auto_confirm
+    )
+
+
+def _run_copy_file(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return copy_file(
+        args.get("source", ""),
+        args.get("destination", ""),
+        auto_confirm
+    )
+
+
+def _run_move_file(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return move_file(
+        args.get("source", ""),
+        args.get("destination", ""),
+        auto_confirm
+    )
+
+
+def _run_parse_json(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return parse_json(
+        args.get("json_string", ""),
+        args.get("query")
+    )
+
+
+def _run_parse_csv(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return parse_csv(
+        args.get("file_path", ""),
+        args.get("delimiter", ",")
+    )
+
+
+def _run_upload_ftp(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return upload_ftp(
+        args.get("local_file", ""),
+        args.get("host", ""),
+        args.get("username"),
+        args.get("password"),
+        args.get("remote_path", ""),
+        auto_confirm
+    )
+
+
+def _run_get_image_info(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return get_image_info(args.get("image_path", ""))
+
+
+def _run_upload_sftp(args: Dict[str, Any], auto_confirm: bool) -> Dict[str, Any]:
+    return upload_sftp(
+        args.get("local_file", ""),
+        args.get("host", ""),
+        args.get("port", 22),
+        args.get("username"),
+        args.get("password"),
+        args.get("key_path"),
+        args.get("remote_path", ""),
+        auto_confirm
+    )
+
+
+# Tool-Dispatcher (built once at import)
+_TOOL_HANDLERS: Dict[str, ToolHandler] = {
+    "execute_bash_command": _run_execute_bash_command,
+    "read_file": _run_read_file,
+    "write_file": _run_write_file,
+    "fetch_url": _run_fetch_url,
+    "download_file": _run_download_file,
+    "search_web": _run_search_web,
+    "rename_file": _run_rename_file,
+    "copy_file": _run_copy_file,
+    "move_file": _run_move_file,
+    "parse_json": _run_parse_json,
+    "parse_csv": _run_parse_csv,
+    "upload_ftp": _run_upload_ftp,
+    "get_image_info": _run_get_image_info,
+    "upload_sftp": _run_upload_sftp,
+}
+
+
+# ============================================================================
+# Argument Validation
+# ============================================================================
+
+# JSON Schema type -> Python type
+_JSON_TYPES: Dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
+ArgValidator = Callable[[Dict[str, Any]], Optional[str]]
+
+
+def _compile_validator(parameters: Dict[str, Any]) -> ArgValidator:
+    """
+    Compiles a tool's parameter schema into a check function.
+
+    Checks required arguments, types and enums. Optional arguments may be
+    null, since models often send null instead of leaving them out;
+    execute_tool drops them so the handler defaults apply.
+    """
+    required = tuple(parameters.get("required", ()))
+
+    # name -> (type name, Python type, reject bool, enum); messages are built on failure only
+    checks: Dict[str, Tuple[str, Any, bool, frozenset]] = {
+        name: (
+            spec["type"],
+            _JSON_TYPES[spec["type"]],
+            # bool is a subclass of int, but not a JSON integer/number
+            spec["type"] in ("integer", "number"),
+            frozenset(spec.get("enum", ())),
+        )
+        for name, spec in parameters.get("properties", {}).items()
+    }
+
+    def validate(args: Dict[str, Any]) -> Optional[str]:
+        for name in required:
+            if args.get(name) is None:
+                return f"Missing required argument '{name}'"
+        # Only the passed arguments are checked; unknown ones are ignored
+        for name, value in args.items():
+            check = checks.get(name)
+            if check is None or value is None:
+                continue
+            type_name, python_type, reject_bool, enum = check
+            if not isinstance(value, python_type) or (reject_bool and isinstance(value, bool)):
+                return f"Argument '{name}' must be of type {type_name}"
+            if enum and value not in enum:
+                return f"Argument '{name}' must be one of: {', '.join(sorted(enum))}"
+        return None
+
+    return validate
+
+
+# Validators (compiled once at import)
+_VALIDATORS: Dict[str, ArgValidator] = {
+    name: _compile_validator(tool["function"]["parameters"])
+    for name, tool in TOOLS_BY_NAME.items()
+}
+
+
+# Tools without side effects or confirmation prompts; only these run in parallel
+PARALLEL_SAFE_TOOLS = frozenset({
+    "read_file",
+    "fetch_url",
+    "search_web",
+    "parse_json",
+    "parse_csv",
+    "get_image_info",
+})
+
+MAX_PARALLEL_TOOLS = 8
+
+# Threads are only started on first use
+_tool_pool = ThreadPoolExecutor(max_workers=MAX_PARALLEL_TOOLS, thread_name_prefix="tool")
 
 
 # ============================================================================
@@ -37,81 +255,58 @@ def execute_tool(
     Returns:
         Result dictionary with success, message/error and additional data
     """
-    logger.debug(f"Executing tool: {tool_name} with args: {tool_args}")
-
-    # Tool-Dispatcher
-    tool_handlers = {
-        "execute_bash_command": lambda: execute_bash_command(
-            tool_args.get("command", ""),
-            tool_args.get("explanation", ""),
-            auto_confirm
-        ),
-        "read_file": lambda: read_file(tool_args.get("file_path", "")),
-        "write_file": lambda: write_file(
-            tool_args.get("file_path", ""),
-            tool_args.get("content", ""),
-            auto_confirm
-        ),
-        "fetch_url": lambda: fetch_url(
-            tool_args.get("url", ""),
-            tool_args.get("method", "GET")
-        ),
-        "download_file": lambda: download_file(
-            tool_args.get("url", ""),
-            tool_args.get("destination", ""),
-            auto_confirm
-        ),
-        "search_web": lambda: search_web(
-            tool_args.get("query", ""),
-            tool_args.get("num_results", 5)
-        ),
-        "rename_file": lambda: rename_file(
-            tool_args.get("old_path", ""),
-            tool_args.get("new_path", ""),
-            auto_confirm
-        ),
-        "copy_file": lambda: copy_file(
-            tool_args.get("source", ""),
-            tool_args.get("destination", ""),
-            auto_confirm
-        ),
-        "move_file": lambda: move_file(
-            tool_args.get("source", ""),
-            tool_args.get("destination", ""),
-            auto_confirm
-        ),
-        "parse_json": lambda: parse_json(
-            tool_args.get("json_string", ""),
-            tool_args.get("query")
-        ),
-        "parse_csv": lambda: parse_csv(
-            tool_args.get("file_path", ""),
-            tool_args.get("delimiter", ",")
-        ),
-        "upload_ftp": lambda: upload_ftp(
-            tool_args.get("local_file", ""),
-            tool_args.get("host", ""),
-            tool_args.get("username"),
-            tool_args.get("password"),
-            tool_args.get("remote_path", ""),
-            auto_confirm
-        ),
-        "get_image_info": lambda: get_image_info(tool_args.get("image_path", "")),
-        "upload_sftp": lambda: upload_sftp(
-            tool_args.get("local_file", ""),
-            tool_args.get("host", ""),
-            tool_args.get("port", 22),
-            tool_args.get("username"),
-            tool_args.get("password"),
-            tool_args.get("key_path"),
-            tool_args.get("remote_path", ""),
-            auto_confirm
-        )
-    }
+    # Formatted only if DEBUG is enabled - tool_args may hold whole file contents
+    logger.debug("Executing tool: %s with args: %s", tool_name, tool_args)
 
-    handler = tool_handlers.get(tool_name)
-    if handler:
-        return handler()
-    else:
+    handler = _TOOL_HANDLERS.get(tool_name)
+    if not handler:
         logger.error(f"Unknown tool: {tool_name}")
         return _create_result(success=False, error=f"Unknown tool: {tool_name}")
+
+    if not isinstance(tool_args, dict):
+        return _create_result(success=False, error="Tool arguments must be a JSON object")
+
+    error = _VALIDATORS[tool_name](tool_args)
+    if error:
+        logger.warning(f"Invalid arguments for {tool_name}: {error}")
+        return _create_result(success=False, error=f"Invalid arguments for {tool_name}: {error}")
+
+    # A null optional argument means "not given"; handlers only fall back to
+    # their defaults for missing keys (args.get(name, default))
+    if None in tool_args.values():
+        tool_args = {name: value for name, value in tool_args.items() if value is not None}
+
+    return handler(tool_args, auto_confirm)
+
+
+def execute_tools_batch(
+    calls: Sequence[Tuple[str, Dict[str, Any]]],
+    auto_confirm: bool = False
+) -> List[Dict[str, Any]]:
+    """
+    Executes several tool calls and returns the results in call order.
+
+    If every call is a read-only tool (PARALLEL_SAFE_TOOLS), the calls run
+    concurrently. Otherwise they run one after another, so later calls see
+    the effects of earlier ones and confirmation prompts don't overlap.
+
+    Args:
+        calls: (tool_name, tool_args) pairs
+        auto_confirm: Whether actions are automatically confirmed
+
+    Returns:
+        List of result dictionaries
+    """
+    if len(calls) < 2 or not all(name in PARALLEL_SAFE_TOOLS for name, _ in calls):
+        return [execute_tool(name, args, auto_confirm) for name, args in calls]
+
+    futures = [_tool_pool.submit(execute_tool, name, args, auto_confirm) for name, args in calls]
+    return [future.result() for future in futures]
+
+
+def reset_caches() -> None:
+    """Clears the cached file reads of read_file, parse_csv and get_image_info (for tests)."""
+    _read_text_cached.cache_clear()
+    _read_csv_cached.cache_clear()
+    _read_image_info_cached.cache_clear()
+    logger.debug("Tool caches reset")
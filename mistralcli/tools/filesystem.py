@@ -7,20 +7,88 @@ Version: 1.5.2
 """
 
 import os
+import mmap
+import stat
+import codecs
 import shutil
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Tuple
 
 from ..core.logging_config import logger
 from ..security.path_validator import validate_path
 from ..security.sanitizers import sanitize_path
-from ..utils.helpers import check_file_operation_safety
+from ..utils.helpers import FileCacheKey, check_file_operation_safety, ensure_parent_dir, file_cache_key
 from .system import _get_user_confirmation, _create_result
 
 
+# Number of characters of written content shown before confirmation
+PREVIEW_CHARS = 100
+
+# Files larger than this are read through mmap
+MMAP_THRESHOLD = 1024 * 1024
+
+# Only the beginning of files larger than this is returned
+MAX_READ_BYTES = 10 * 1024 * 1024
+
+# Minimum read size for files not read through mmap
+READ_CHUNK_SIZE = 64 * 1024
+
+# Number of unchanged files (up to MMAP_THRESHOLD) kept decoded in memory
+READ_CACHE_SIZE = 32
+
 # ============================================================================
 # File Operations
 # ============================================================================
 
+def _content_preview(content: str) -> str:
+    """Returns a short, single-line preview of file content."""
+    if '\x00' in content[:1024]:
+        return f"<binary, {len(content)} characters>"
+    preview = content[:PREVIEW_CHARS].replace('\n', '\\n')
+    return preview + "..." if len(content) > PREVIEW_CHARS else preview
+
+
+def _read_text(path: str) -> Tuple[str, bool]:
+    """Reads a UTF-8 file; returns (content, truncated)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size > MMAP_THRESHOLD:
+            truncated = size > MAX_READ_BYTES
+            # Decoded straight from the mapping, without a bytes copy;
+            # a character cut off by the limit is dropped instead of failing
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mmap, 'MADV_SEQUENTIAL'):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mapped) as view, view[:MAX_READ_BYTES] as chunk:
+                    content = codecs.getincrementaldecoder('utf-8')().decode(chunk, final=not truncated)
+        else:
+            # st_size is only a hint: reads may return less, the file may
+            # grow meanwhile, and procfs files report size 0
+            data = bytearray()
+            while len(data) <= MAX_READ_BYTES:
+                chunk = os.read(fd, max(size + 1 - len(data), READ_CHUNK_SIZE))
+                if not chunk:
+                    break
+                data += chunk
+            truncated = len(data) > MAX_READ_BYTES
+            with memoryview(data) as view, view[:MAX_READ_BYTES] as chunk:
+                content = codecs.getincrementaldecoder('utf-8')().decode(chunk, final=not truncated)
+    finally:
+        os.close(fd)
+
+    # Same newline handling as text mode
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content, truncated
+
+
+@lru_cache(maxsize=READ_CACHE_SIZE)
+def _read_text_cached(key: FileCacheKey) -> Tuple[str, bool]:
+    """_read_text for files that have not changed since (see file_cache_key)."""
+    return _read_text(key[0])
+
+
 def read_file(file_path: str) -> Dict[str, Any]:
     """Reads the contents of a file with path validation."""
     logger.info(f"Reading file: {file_path}")
@@ -35,9 +103,16 @@ def read_file(file_path: str) -> Dict[str, Any]:
 
     try:
         path = sanitize_path(file_path)
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        # Repeated reads of an unchanged small file are served from memory
+        # (not files reporting size 0: procfs content changes without mtime)
+        key = file_cache_key(path)
+        if key is not None and 0 < key[3] <= MMAP_THRESHOLD:
+            content, truncated = _read_text_cached(key)
+        else:
+            content, truncated = _read_text(path)
         logger.info(f"File read: {len(content)} characters")
+        if truncated:
+            return _create_result(success=True, content=content, truncated=True)
         return _create_result(success=True, content=content)
     except FileNotFoundError:
         logger.error(f"File not found: {file_path}")
@@ -50,6 +125,22 @@ def read_file(file_path: str) -> Dict[str, Any]:
         return _create_result(success=False, error=str(e))
 
 
+def _write_text(path: str, content: str) -> None:
+    """Writes a string as UTF-8 with one write call for the whole content."""
+    # Same newline handling as text mode
+    if os.linesep != '\n':
+        content = content.replace('\n', os.linesep)
+    data = memoryview(content.encode('utf-8'))
+
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0)
+    fd = os.open(path, flags, 0o666)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
 def write_file(
     file_path: str,
     content: str,
@@ -59,8 +150,7 @@ def write_file(
     logger.info(f"Writing file: {file_path}")
 
     print(f"\n[Tool Call] Write file: {file_path}")
-    preview = content[:100] + "..." if len(content) > 100 else content
-    print(f"  Content: {preview}")
+    print(f"  Content: {_content_preview(content)}")
 
     # Path validation
     is_safe, message = validate_path(file_path)
@@ -76,12 +166,9 @@ def write_file(
     try:
         path = sanitize_path(file_path)
         # Create directory if necessary
-        parent_dir = os.path.dirname(path)
-        if parent_dir:
-            os.makedirs(parent_dir, exist_ok=True)
+        ensure_parent_dir(path)
 
-        with open(path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        _write_text(path, content)
         logger.info(f"File written: {len(content)} characters")
         return _create_result(success=True, message="File written successfully")
     except PermissionError:
@@ -133,6 +220,44 @@ def rename_file(
         return _create_result(success=False, error=str(e))
 
 
+def _copy2(src: str, dst: str) -> str:
+    """
+    shutil.copy2 using copy_file_range where available.
+
+    copy_file_range copies inside the kernel and lets filesystems like
+    btrfs and XFS share blocks (reflink) instead of duplicating them.
+    """
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    src_stat = os.stat(src)
+    if (
+        not hasattr(os, 'copy_file_range')
+        or not stat.S_ISREG(src_stat.st_mode)
+        or src_stat.st_size == 0  # e.g. /proc files report size 0
+        or (os.path.exists(dst) and os.path.samefile(src, dst))
+    ):
+        return shutil.copy2(src, dst)
+
+    copied = 0
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            while True:
+                count = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+                if not count:
+                    break
+                copied += count
+    except OSError:
+        # Not supported for this filesystem pair (or kernel); copy normally
+        copied = -1
+    # Some filesystems (and older kernels across filesystems) report 0
+    # before the end instead of failing; copy normally then as well
+    if copied != src_stat.st_size:
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+    return dst
+
+
 def copy_file(
     source: str,
     destination: str,
@@ -161,13 +286,11 @@ def copy_file(
         dst = sanitize_path(destination)
 
         if os.path.isdir(src):
-            shutil.copytree(src, dst)
+            shutil.copytree(src, dst, copy_function=_copy2)
         else:
             # Create destination directory if necessary
-            parent_dir = os.path.dirname(dst)
-            if parent_dir:
-                os.makedirs(parent_dir, exist_ok=True)
-            shutil.copy2(src, dst)
+            ensure_parent_dir(dst)
+            _copy2(src, dst)
 
         logger.info("Copy successful")
         return _create_result(success=True, message=f"Successfully copied from {src} to {dst}")
@@ -209,9 +332,7 @@ def move_file(
         src = sanitize_path(source)
         dst = sanitize_path(destination)
         # Create destination directory if necessary
-        parent_dir = os.path.dirname(dst)
-        if parent_dir:
-            os.makedirs(parent_dir, exist_ok=True)
+        ensure_parent_dir(dst)
         shutil.move(src, dst)
         logger.info("Move successful")
         return _create_result(success=True, message=f"Successfully moved from {src} to {dst}")
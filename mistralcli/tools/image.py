@@ -7,18 +7,143 @@ Version: 1.5.2
 """
 
 import os
-from typing import Dict, Any
+import struct
+from functools import lru_cache
+from typing import Dict, Any, BinaryIO, Optional, Tuple
 
 from ..core.logging_config import logger
 from ..security.path_validator import validate_path
 from ..security.sanitizers import sanitize_path
+from ..utils.helpers import FileCacheKey, file_cache_key
 from .system import _create_result
 
 
+# ============================================================================
+# Header Parsing
+# ============================================================================
+
+# (format, mode, width, height)
+ImageHeader = Tuple[str, str, int, int]
+
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+# (color type, bit depth) -> PIL mode; other combinations are left to PIL
+_PNG_MODES = {
+    (0, 8): "L",
+    (2, 8): "RGB",
+    (3, 8): "P",
+    (4, 8): "LA",
+    (6, 8): "RGBA",
+}
+
+# Start-of-frame markers (SOF0-SOF15 without DHT, JPG and DAC)
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+_JPEG_MODES = {1: "L", 3: "RGB", 4: "CMYK"}
+
+# Number of unchanged images whose analysis is kept in memory
+IMAGE_CACHE_SIZE = 256
+
+
+def _read_png_header(f: BinaryIO) -> Optional[ImageHeader]:
+    """Reads format and size from the PNG IHDR chunk."""
+    head = f.read(26)
+    if len(head) < 26 or head[:8] != _PNG_SIGNATURE or head[12:16] != b'IHDR':
+        return None
+    width, height, depth, color_type = struct.unpack('>IIBB', head[16:26])
+    mode = _PNG_MODES.get((color_type, depth))
+    return ("PNG", mode, width, height) if mode else None
+
+
+def _read_jpeg_header(f: BinaryIO) -> Optional[ImageHeader]:
+    """Reads format and size from the first JPEG start-of-frame segment."""
+    if f.read(2) != b'\xff\xd8':
+        return None
+    while True:
+        segment = f.read(4)
+        if len(segment) < 4 or segment[0] != 0xFF:
+            return None
+        marker = segment[1]
+        if marker in _JPEG_SOF_MARKERS:
+            frame = f.read(6)
+            if len(frame) < 6:
+                return None
+            _, height, width, components = struct.unpack('>BHHB', frame)
+            mode = _JPEG_MODES.get(components)
+            return ("JPEG", mode, width, height) if mode and height else None
+        if marker == 0xDA:
+            # Start of scan without a frame header
+            return None
+        (length,) = struct.unpack('>H', segment[2:4])
+        f.seek(length - 2, os.SEEK_CUR)
+
+
+def _read_image_header(path: str) -> Optional[ImageHeader]:
+    """Determines PNG/JPEG format and size without decoding the image."""
+    with open(path, 'rb') as f:
+        magic = f.read(2)
+        f.seek(0)
+        if magic == b'\x89P':
+            return _read_png_header(f)
+        if magic == b'\xff\xd8':
+            return _read_jpeg_header(f)
+    return None
+
+
 # ============================================================================
 # Image Analysis
 # ============================================================================
 
+def _read_image_info(path: str) -> Dict[str, Any]:
+    """Reads format and size of an image (without the success field)."""
+    file_size = os.path.getsize(path)
+
+    # Common formats are read from the header, without PIL
+    header = _read_image_header(path)
+    if header is not None:
+        image_format, mode, width, height = header
+        logger.info(f"Image analyzed: {image_format} {width}x{height}")
+        return {
+            "format": image_format,
+            "mode": mode,
+            "size": (width, height),
+            "width": width,
+            "height": height,
+            "file_size": file_size,
+        }
+
+    # Try to import PIL/Pillow (optional)
+    try:
+        from PIL import Image
+    except ImportError:
+        # Fallback without PIL - only file size
+        logger.info(f"Image file size (without PIL): {file_size} bytes")
+        return {
+            "file_size": file_size,
+            "message": "PIL not installed - only file size available. Install with: pip install Pillow",
+        }
+
+    with Image.open(path) as img:
+        logger.info(f"Image analyzed: {img.format} {img.width}x{img.height}")
+        return {
+            "format": img.format,
+            "mode": img.mode,
+            "size": img.size,
+            "width": img.width,
+            "height": img.height,
+            "file_size": file_size,
+        }
+
+
+@lru_cache(maxsize=IMAGE_CACHE_SIZE)
+def _read_image_info_cached(key: FileCacheKey) -> Dict[str, Any]:
+    """
+    _read_image_info for files that have not changed since (see file_cache_key).
+
+    The returned dict is shared between calls and must not be modified.
+    """
+    return _read_image_info(key[0])
+
+
 def get_image_info(image_path: str) -> Dict[str, Any]:
     """Analyzes an image with path validation."""
     logger.info(f"Analyzing image: {image_path}")
@@ -39,32 +164,14 @@ def get_image_info(image_path: str) -> Dict[str, Any]:
             logger.error(f"Image not found: {image_path}")
             return _create_result(success=False, error="File not found")
 
-        # Try to import PIL/Pillow (optional)
-        try:
-            from PIL import Image
-
-            with Image.open(path) as img:
-                result = _create_result(
-                    success=True,
-                    format=img.format,
-                    mode=img.mode,
-                    size=img.size,
-                    width=img.width,
-                    height=img.height,
-                    file_size=os.path.getsize(path)
-                )
-                logger.info(f"Image analyzed: {img.format} {img.width}x{img.height}")
-                return result
-
-        except ImportError:
-            # Fallback without PIL - only file size
-            file_size = os.path.getsize(path)
-            logger.info(f"Image file size (without PIL): {file_size} bytes")
-            return _create_result(
-                success=True,
-                file_size=file_size,
-                message="PIL not installed - only file size available. Install with: pip install Pillow"
-            )
+        # Repeated analyses of an unchanged image are served from memory;
+        # failures raise and are therefore never cached
+        key = file_cache_key(path)
+        if key is not None:
+            info = _read_image_info_cached(key)
+        else:
+            info = _read_image_info(path)
+        return _create_result(success=True, **info)
 
     except Exception as e:
         logger.error(f"Image analysis failed: {e}")
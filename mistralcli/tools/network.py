@@ -6,17 +6,353 @@ HTTP requests, downloads and web search
 Version: 1.5.2
 """
 
+import os
 import re
+import ssl
 import html
-from typing import Dict, Any, List
-from urllib.request import urlopen, Request
+import time
+import socket
+import codecs
+import atexit
+import threading
+import http.client
+from itertools import islice
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Tuple
+from urllib.request import urlopen, Request, getproxies
 from urllib.error import URLError, HTTPError
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urljoin, urlsplit
 
-from ..core.config import DEFAULT_TIMEOUT
+from ..core.config import DEFAULT_TIMEOUT, URL_CACHE_DIR, URL_CACHE_SIZE_LIMIT
 from ..core.logging_config import logger
 from ..security.url_validator import validate_url
-from .system import _create_result
+from ..security.path_validator import validate_path
+from ..security.sanitizers import sanitize_path
+from ..utils.helpers import ensure_parent_dir
+from .system import _get_user_confirmation, _create_result
+
+
+# fetch_url output limit (characters)
+MAX_FETCH_CHARS = 10000
+
+# Download limits
+MAX_DOWNLOAD_SIZE = 100 * 1024 * 1024  # 100 MB
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024       # 1 MB
+
+# DuckDuckGo HTML result patterns
+_RESULT_RE = re.compile(r'<a rel="nofollow" class="result__a" href="([^"]+)">([^<]+)</a>')
+_SNIPPET_RE = re.compile(r'<a class="result__snippet"[^>]*>([^<]+)</a>')
+_SNIPPET_MARKER = b'class="result__snippet"'
+SEARCH_READ_CHUNK = 16 * 1024
+# Rest of the result page still read after the needed results, so the
+# keep-alive connection can go back to the pool (larger rests close it)
+SEARCH_DRAIN_LIMIT = 64 * 1024
+
+# Request headers, shared by all calls (never modified)
+_DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+}
+_BROWSER_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+}
+
+
+def _decode_utf8_prefix(raw: bytes) -> str:
+    """Decodes UTF-8 bytes that may end in the middle of a character."""
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    return decoder.decode(raw, final=False)
+
+
+def _read_search_page(response: Any, num_results: int) -> str:
+    """Reads the result page only until num_results snippets are complete."""
+    page = bytearray()
+    seen = 0
+    while True:
+        chunk = response.read(SEARCH_READ_CHUNK)
+        if not chunk:
+            break
+        # Count only the new bytes (plus overlap for a marker split across reads)
+        start = max(0, len(page) - len(_SNIPPET_MARKER) + 1)
+        page += chunk
+        seen += page.count(_SNIPPET_MARKER, start)
+        # The next result's snippet marker means the last needed one is complete
+        if seen > num_results:
+            _drain(response, SEARCH_DRAIN_LIMIT)
+            break
+    return page.decode('utf-8', errors='replace')
+
+
+def _drain(response: Any, limit: int) -> None:
+    """Reads and discards up to limit bytes of the remaining response body."""
+    while limit > 0:
+        chunk = response.read(min(limit, SEARCH_READ_CHUNK))
+        if not chunk:
+            break
+        limit -= len(chunk)
+
+
+# ============================================================================
+# Connection Pool
+# ============================================================================
+
+# Keep-alive connections are reused per (scheme, host, port), so repeated
+# requests to the same host skip the TCP and TLS handshake.
+_MAX_IDLE_PER_HOST = 4
+_MAX_REDIRECTS = 5
+_REDIRECT_CODES = (301, 302, 303, 307, 308)
+
+# Connection errors of idempotent requests are retried with backoff
+_MAX_RETRIES = 2
+_RETRY_BACKOFF = 0.2  # seconds, doubled per attempt
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+_ConnectionKey = Tuple[str, str, int]
+
+_idle_connections: Dict[_ConnectionKey, List[http.client.HTTPConnection]] = {}
+_pool_lock = threading.Lock()
+_ssl_context: Optional[ssl.SSLContext] = None
+
+
+def _new_connection(key: _ConnectionKey) -> http.client.HTTPConnection:
+    """Opens a new (not yet connected) HTTP(S) connection."""
+    global _ssl_context
+    scheme, host, port = key
+    if scheme == "https":
+        if _ssl_context is None:
+            _ssl_context = ssl.create_default_context()
+        return http.client.HTTPSConnection(
+            host, port, timeout=DEFAULT_TIMEOUT, context=_ssl_context
+        )
+    return http.client.HTTPConnection(host, port, timeout=DEFAULT_TIMEOUT)
+
+
+def _acquire_connection(key: _ConnectionKey) -> Tuple[http.client.HTTPConnection, bool]:
+    """Returns an idle connection for the key (or a new one) and whether it was reused."""
+    with _pool_lock:
+        idle = _idle_connections.get(key)
+        if idle:
+            return idle.pop(), True
+    return _new_connection(key), False
+
+
+def _release_connection(
+    key: _ConnectionKey,
+    conn: http.client.HTTPConnection,
+    response: http.client.HTTPResponse
+) -> None:
+    """Returns a connection to the pool if its response was fully consumed."""
+    if response.isclosed() and not response.will_close:
+        with _pool_lock:
+            idle = _idle_connections.setdefault(key, [])
+            if len(idle) < _MAX_IDLE_PER_HOST:
+                idle.append(conn)
+                return
+    conn.close()
+
+
+def _close_idle_connections() -> None:
+    """Closes all idle pooled connections."""
+    with _pool_lock:
+        for idle in _idle_connections.values():
+            for conn in idle:
+                conn.close()
+        _idle_connections.clear()
+
+
+atexit.register(_close_idle_connections)
+
+
+def _send_request(
+    key: _ConnectionKey,
+    method: str,
+    target: str,
+    headers: Dict[str, str]
+) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+    """Sends a request, retrying once if a reused connection went stale."""
+    conn, reused = _acquire_connection(key)
+    try:
+        conn.request(method, target, headers=headers)
+        return conn, conn.getresponse()
+    except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+        conn.close()
+        if not reused:
+            raise
+    # The server closed the idle keep-alive connection - use a fresh one
+    conn = _new_connection(key)
+    conn.request(method, target, headers=headers)
+    return conn, conn.getresponse()
+
+
+def _send_with_retries(
+    key: _ConnectionKey,
+    method: str,
+    target: str,
+    headers: Dict[str, str]
+) -> Tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+    """Sends a request, retrying idempotent methods after connection errors."""
+    attempt = 0
+    while True:
+        try:
+            return _send_request(key, method, target, headers)
+        except (socket.timeout, ssl.SSLError):
+            # Retrying would only multiply the wait / fail the same way
+            raise
+        except (OSError, http.client.HTTPException) as e:
+            if method not in _IDEMPOTENT_METHODS or attempt >= _MAX_RETRIES:
+                raise
+            logger.debug("Retrying %s %s%s after error: %s", method, key[1], target, e)
+            time.sleep(_RETRY_BACKOFF * 2 ** attempt)
+            attempt += 1
+
+
+def _pooled_request(
+    url: str,
+    method: str,
+    headers: Dict[str, str]
+) -> Tuple[_ConnectionKey, http.client.HTTPConnection, http.client.HTTPResponse]:
+    """
+    Performs a request over a pooled connection, following redirects.
+
+    Every redirect target is validated again, so a public URL cannot
+    redirect to a private/local address. Errors are raised as
+    HTTPError/URLError, like urlopen() does.
+    """
+    for _ in range(_MAX_REDIRECTS + 1):
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        key = (scheme, parts.hostname or "", parts.port or (443 if scheme == "https" else 80))
+        target = parts.path or "/"
+        if parts.query:
+            target += "?" + parts.query
+
+        try:
+            conn, response = _send_with_retries(key, method, target, headers)
+        except (OSError, http.client.HTTPException) as e:
+            raise URLError(e) from e
+
+        location = response.getheader("Location")
+        if response.status in _REDIRECT_CODES and location:
+            response.read()
+            _release_connection(key, conn, response)
+
+            url = urljoin(url, location)
+            is_safe, message = validate_url(url)
+            if not is_safe:
+                raise URLError(f"Redirect blocked: {message}")
+            if response.status == 303 or (response.status in (301, 302) and method == "POST"):
+                method = "GET"
+            continue
+
+        if response.status >= 400:
+            conn.close()
+            raise HTTPError(url, response.status, response.reason, response.msg, None)
+
+        return key, conn, response
+
+    raise URLError(f"Too many redirects (max. {_MAX_REDIRECTS})")
+
+
+@contextmanager
+def _open_url(
+    url: str,
+    method: str = "GET",
+    headers: Optional[Dict[str, str]] = None
+) -> Iterator[Any]:
+    """
+    Opens a URL and yields the response (drop-in replacement for urlopen).
+
+    HTTP(S) requests go through the keep-alive connection pool. Other
+    schemes (e.g. ftp) and proxied environments fall back to urlopen.
+    """
+    headers = headers or {}
+    scheme = urlsplit(url).scheme.lower()
+
+    if scheme not in ("http", "https") or scheme in getproxies():
+        req = Request(url, headers=headers, method=method)
+        with urlopen(req, timeout=DEFAULT_TIMEOUT) as response:
+            yield response
+        return
+
+    key, conn, response = _pooled_request(url, method, headers)
+    try:
+        yield response
+    finally:
+        _release_connection(key, conn, response)
+
+
+# ============================================================================
+# URL Cache
+# ============================================================================
+
+# fetch_url keeps GET results with an ETag/Last-Modified on disk and
+# revalidates them with a conditional request; a 304 answer skips the body.
+_url_cache: Any = None
+_url_cache_lock = threading.Lock()
+
+
+def _get_url_cache() -> Optional[Any]:
+    """Opens the persistent URL cache on first use (None without diskcache)."""
+    global _url_cache
+    with _url_cache_lock:
+        if _url_cache is None:
+            try:
+                import diskcache
+                _url_cache = diskcache.Cache(str(URL_CACHE_DIR), size_limit=URL_CACHE_SIZE_LIMIT)
+            except ImportError:
+                _url_cache = False
+            except Exception as e:
+                logger.warning(f"URL cache unavailable: {e}")
+                _url_cache = False
+        # Not 'or None': diskcache.Cache defines __len__, so an empty cache is falsy
+        return _url_cache if _url_cache is not False else None
+
+
+def _lookup_cached_fetch(cache: Any, url: str) -> Optional[Dict[str, Any]]:
+    """Returns the cached fetch_url entry for a URL (None if missing or unreadable)."""
+    try:
+        return cache.get(url)
+    except Exception as e:
+        logger.debug(f"URL cache read failed: {e}")
+        return None
+
+
+def _store_cached_fetch(cache: Any, url: str, response: Any, result: Dict[str, Any]) -> None:
+    """Stores a fetch_url result if the response can be revalidated later."""
+    etag = response.headers.get('ETag')
+    last_modified = response.headers.get('Last-Modified')
+    if not etag and not last_modified:
+        return
+    try:
+        cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "content": result["content"],
+            "content_type": result["content_type"],
+            "status_code": result["status_code"],
+        }
+    except Exception as e:
+        logger.debug(f"URL cache write failed: {e}")
+
+
+def _revalidation_headers(cached: Dict[str, Any]) -> Dict[str, str]:
+    """Request headers for a conditional GET of a cached entry."""
+    headers = dict(_BROWSER_HEADERS)
+    if cached["etag"]:
+        headers['If-None-Match'] = cached["etag"]
+    if cached["last_modified"]:
+        headers['If-Modified-Since'] = cached["last_modified"]
+    return headers
+
+
+def _cached_fetch_result(cached: Dict[str, Any]) -> Dict[str, Any]:
+    """fetch_url result for a cached entry the server reported as not modified."""
+    logger.info(f"URL not modified, using cached content: {len(cached['content'])} characters")
+    return _create_result(
+        success=True,
+        content=cached["content"],
+        content_type=cached["content_type"],
+        status_code=cached["status_code"]
+    )
 
 
 # ============================================================================
@@ -37,28 +373,45 @@ def fetch_url(url: str, method: str = "GET") -> Dict[str, Any]:
         print(f"  ⚠️  {message}")
         return _create_result(success=False, error=message)
 
-    try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        }
-        req = Request(url, headers=headers, method=method)
+    # Cached GET results are revalidated instead of downloaded again
+    cache = _get_url_cache() if method == "GET" else None
+    cached = _lookup_cached_fetch(cache, url) if cache is not None else None
+    headers = _revalidation_headers(cached) if cached else _BROWSER_HEADERS
 
-        with urlopen(req, timeout=DEFAULT_TIMEOUT) as response:
-            content = response.read().decode('utf-8')
+    try:
+        with _open_url(url, method, headers) as response:
+            if cached and response.status == 304:
+                response.read()
+                return _cached_fetch_result(cached)
+
+            # Only read as many bytes as the character limit can use
+            # (UTF-8 needs at most 4 bytes per character)
+            raw = response.read(MAX_FETCH_CHARS * 4)
+            truncated = bool(response.read(1))
+            content = _decode_utf8_prefix(raw)
             content_type = response.headers.get('Content-Type', '')
 
-            # Limit output to 10000 characters
-            if len(content) > 10000:
-                content = content[:10000] + "\n... (truncated)"
+            # Limit output to MAX_FETCH_CHARS characters
+            if len(content) > MAX_FETCH_CHARS:
+                content = content[:MAX_FETCH_CHARS]
+                truncated = True
+            if truncated:
+                content += "\n... (truncated)"
 
             logger.info(f"URL fetched: {len(content)} characters, status: {response.status}")
-            return _create_result(
+            result = _create_result(
                 success=True,
                 content=content,
                 content_type=content_type,
                 status_code=response.status
             )
+            if cache is not None and response.status == 200:
+                _store_cached_fetch(cache, url, response, result)
+            return result
     except HTTPError as e:
+        # urlopen (proxies, ftp) raises for 304 instead of returning it
+        if cached and e.code == 304:
+            return _cached_fetch_result(cached)
         logger.error(f"HTTP error: {e.code} {e.reason}")
         return _create_result(success=False, error=f"HTTP error {e.code}: {e.reason}")
     except URLError as e:
@@ -75,11 +428,6 @@ def download_file(
     auto_confirm: bool = False
 ) -> Dict[str, Any]:
     """Downloads a file with URL and path validation."""
-    import os
-    from ..security.path_validator import validate_path
-    from ..security.sanitizers import sanitize_path
-    from .system import _get_user_confirmation
-
     logger.info(f"Download: {url} -> {destination}")
 
     print(f"\n[Tool Call] Download file:")
@@ -105,33 +453,49 @@ def download_file(
         return _create_result(success=False, error="User declined download")
 
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-        }
-        req = Request(url, headers=headers)
-
-        with urlopen(req, timeout=DEFAULT_TIMEOUT) as response:
-            content = response.read()
-
-            # Check download limit (100 MB)
-            MAX_DOWNLOAD_SIZE = 100 * 1024 * 1024  # 100 MB
-            if len(content) > MAX_DOWNLOAD_SIZE:
-                logger.warning(f"Download too large: {len(content)} bytes")
+        with _open_url(url, headers=_DEFAULT_HEADERS) as response:
+            # Check download limit before transferring the body
+            content_length = response.headers.get('Content-Length', '')
+            if content_length.isdigit() and int(content_length) > MAX_DOWNLOAD_SIZE:
+                logger.warning(f"Download too large: {content_length} bytes")
                 return _create_result(
                     success=False,
-                    error=f"File too large ({len(content) / 1024 / 1024:.1f} MB). Maximum: 100 MB"
+                    error=f"File too large ({int(content_length) / 1024 / 1024:.1f} MB). Maximum: 100 MB"
                 )
 
             dest_path = sanitize_path(destination)
             # Create directory if necessary
-            parent_dir = os.path.dirname(dest_path)
-            if parent_dir:
-                os.makedirs(parent_dir, exist_ok=True)
+            ensure_parent_dir(dest_path)
+
+            # Stream into a temporary file so an aborted download never
+            # replaces an existing destination
+            part_path = dest_path + ".part"
+            file_size = 0
+            try:
+                with open(part_path, 'wb') as f:
+                    while True:
+                        chunk = response.read(DOWNLOAD_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        file_size += len(chunk)
+                        if file_size > MAX_DOWNLOAD_SIZE:
+                            break
+                        f.write(chunk)
+
+                if file_size > MAX_DOWNLOAD_SIZE:
+                    os.remove(part_path)
+                    logger.warning(f"Download too large: more than {MAX_DOWNLOAD_SIZE} bytes")
+                    return _create_result(
+                        success=False,
+                        error="File too large (more than 100 MB). Maximum: 100 MB"
+                    )
+
+                os.replace(part_path, dest_path)
+            except BaseException:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+                raise
 
-            with open(dest_path, 'wb') as f:
-                f.write(content)
-
-            file_size = len(content)
             logger.info(f"Download successful: {file_size} bytes")
             return _create_result(
                 success=True,
@@ -150,10 +514,54 @@ def download_file(
         return _create_result(success=False, error=str(e))
 
 
+SearchResults = List[Dict[str, str]]
+
+
+def _parse_results_lexbor(html_content: str, num_results: int) -> Optional[SearchResults]:
+    """Extracts search results with selectolax's C parser (None if not installed)."""
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        return None
+
+    tree = LexborHTMLParser(html_content)
+    links = tree.css('a.result__a')[:num_results]
+    snippets = tree.css('a.result__snippet')[:num_results]
+
+    # The parser decodes entities and also keeps text in nested tags (<b>)
+    return [
+        {
+            "title": link.text(),
+            "url": link.attributes.get("href") or "",
+            "snippet": snippets[i].text() if i < len(snippets) else "",
+        }
+        for i, link in enumerate(links)
+    ]
+
+
+def _parse_results_regex(html_content: str, num_results: int) -> SearchResults:
+    """Extracts search results with the precompiled regexes."""
+    unescape = html.unescape
+
+    # Find results in HTML (stop scanning after num_results matches)
+    matches = islice(_RESULT_RE.finditer(html_content), num_results)
+    snippets = [m.group(1) for m in islice(_SNIPPET_RE.finditer(html_content), num_results)]
+
+    # Built in one pass; html.unescape returns at once for text without '&'
+    return [
+        {
+            "title": unescape(match.group(2)),
+            "url": match.group(1),
+            "snippet": unescape(snippets[i]) if i < len(snippets) else "",
+        }
+        for i, match in enumerate(matches)
+    ]
+
+
 def search_web(query: str, num_results: int = 5) -> Dict[str, Any]:
     """Searches the web with DuckDuckGo."""
     # Limit results to maximum 10
-    num_results = min(num_results, 10)
+    num_results = max(0, min(num_results, 10))
 
     logger.info(f"Web search: '{query}' (max {num_results} results)")
 
@@ -171,35 +579,12 @@ def search_web(query: str, num_results: int = 5) -> Dict[str, Any]:
         # Use DuckDuckGo HTML (no API key required)
         search_url = f"https://html.duckduckgo.com/html/?q={quote_plus(query)}"
 
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-        }
-        req = Request(search_url, headers=headers)
-
-        with urlopen(req, timeout=DEFAULT_TIMEOUT) as response:
-            html_content = response.read().decode('utf-8')
-
-        # Simple parsing of search results (regex-based)
-        results: List[Dict[str, str]] = []
-
-        # Find results in HTML
-        result_pattern = r'<a rel="nofollow" class="result__a" href="([^"]+)">([^<]+)</a>'
-        snippet_pattern = r'<a class="result__snippet"[^>]*>([^<]+)</a>'
-
-        matches = re.findall(result_pattern, html_content)
-        snippets = re.findall(snippet_pattern, html_content)
-
-        for i, (url, title) in enumerate(matches[:num_results]):
-            snippet = snippets[i] if i < len(snippets) else ""
-            # Decode HTML entities
-            title = html.unescape(title)
-            snippet = html.unescape(snippet)
+        with _open_url(search_url, headers=_DEFAULT_HEADERS) as response:
+            html_content = _read_search_page(response, num_results)
 
-            results.append({
-                "title": title,
-                "url": url,
-                "snippet": snippet
-            })
+        results = _parse_results_lexbor(html_content, num_results)
+        if results is None:
+            results = _parse_results_regex(html_content, num_results)
 
         if not results:
             logger.warning(f"No search results for: {query}")
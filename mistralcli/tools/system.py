@@ -6,11 +6,14 @@ Bash command execution with security checks
 Version: 1.5.2
 """
 
-import os
+import re
+import shlex
+import shutil
 import subprocess
-from typing import Dict, Any
+import sys
+from typing import Dict, Any, Callable, List, Optional
 
-from ..core.config import DEFAULT_TIMEOUT
+from ..core.config import DEFAULT_TIMEOUT, YES_ANSWERS
 from ..core.logging_config import logger
 from ..security.command_validator import get_command_risk_info
 from ..utils.formatting import format_risk_warning
@@ -20,6 +23,32 @@ from ..utils.formatting import format_risk_warning
 # Helper Functions
 # ============================================================================
 
+ConfirmationHandler = Callable[[str], bool]
+
+# Answers confirmation prompts instead of stdin (scripted/embedded use)
+_confirmation_handler: Optional[ConfirmationHandler] = None
+
+
+def set_confirmation_handler(handler: Optional[ConfirmationHandler]) -> None:
+    """
+    Sets a callback that answers tool confirmation prompts.
+
+    The callback receives the prompt (e.g. "Write?") and returns True to
+    confirm. None restores the interactive prompt on stdin.
+    """
+    global _confirmation_handler
+    _confirmation_handler = handler
+
+
+def _read_line(prompt: str) -> str:
+    """Reads one line; uses input() only for terminals (readline editing)."""
+    if sys.stdin.isatty():
+        return input(prompt)
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    return sys.stdin.readline()
+
+
 def _get_user_confirmation(prompt: str) -> bool:
     """
     Asks the user for confirmation.
@@ -30,14 +59,18 @@ def _get_user_confirmation(prompt: str) -> bool:
     Returns:
         True if confirmed, False otherwise
     """
-    response = input(f"  {prompt} (y/n): ").strip().lower()
-    return response in ['y', 'yes', 'j', 'ja']
+    if _confirmation_handler is not None:
+        return _confirmation_handler(prompt)
+
+    response = _read_line(f"  {prompt} (y/n): ").strip()
+    # Lowercase answers (the usual case) match without creating a new string
+    return response in YES_ANSWERS or response.lower() in YES_ANSWERS
 
 
 def _create_result(
     success: bool,
-    message: str = None,
-    error: str = None,
+    message: Optional[str] = None,
+    error: Optional[str] = None,
     **kwargs: Any
 ) -> Dict[str, Any]:
     """
@@ -57,7 +90,8 @@ def _create_result(
         result["message"] = message
     if error:
         result["error"] = error
-    result.update(kwargs)
+    if kwargs:
+        result.update(kwargs)
     return result
 
 
@@ -65,6 +99,46 @@ def _create_result(
 # Bash Command Execution
 # ============================================================================
 
+# Characters that need shell interpretation (operators, expansions,
+# globbing, comments, escapes)
+_SHELL_METACHARS_RE = re.compile(r'[|&;<>()$`\\*?\[\]{}~#!\n]')
+
+
+def _split_simple_command(command: str) -> Optional[List[str]]:
+    """
+    Splits a command that can be executed without a shell.
+
+    Args:
+        command: The shell command
+
+    Returns:
+        Argument list, or None if the command needs a shell
+    """
+    if _SHELL_METACHARS_RE.search(command):
+        return None
+
+    try:
+        args = shlex.split(command)
+    except ValueError:
+        return None
+
+    # Variable assignments and shell builtins need a shell
+    if not args or '=' in args[0] or shutil.which(args[0]) is None:
+        return None
+
+    return args
+
+
+def _decode_output(data: bytes) -> str:
+    """Decodes command output with universal newlines."""
+    if not data:
+        return ""
+    output = data.decode('utf-8', errors='replace')
+    if '\r' in output:
+        output = output.replace('\r\n', '\n').replace('\r', '\n')
+    return output
+
+
 def execute_bash_command(
     command: str,
     explanation: str,
@@ -72,7 +146,7 @@ def execute_bash_command(
 ) -> Dict[str, Any]:
     """Executes a Bash command with extended security checks."""
     logger.info(f"Bash command: {command}")
-    logger.debug(f"Explanation: {explanation}")
+    logger.debug("Explanation: %s", explanation)
 
     print(f"\n[Tool Call] Execute Bash command:")
     print(f"  Command: {command}")
@@ -103,16 +177,18 @@ def execute_bash_command(
             return _create_result(success=False, message="User declined execution")
 
     try:
+        # Simple commands are executed directly, without spawning /bin/sh
+        args = _split_simple_command(command)
         result = subprocess.run(
-            command,
-            shell=True,
+            args if args is not None else command,
+            shell=args is None,
             capture_output=True,
-            text=True,
-            cwd=os.getcwd(),
             timeout=DEFAULT_TIMEOUT
         )
 
-        output = result.stdout if result.stdout else result.stderr
+        # Only the returned stream is decoded (as text=True would, but
+        # without failing on non-UTF-8 output)
+        output = _decode_output(result.stdout if result.stdout else result.stderr)
         logger.info(f"Command executed, exit code: {result.returncode}")
 
         return _create_result(
@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """
 Mistral CLI - Utils Module
-Helper functions: Token Management, Formatting, Helpers
+Helper functions: Token Management, Formatting, Helpers, Serialization
 
 Version: 1.5.2
 """
 
-from .token_manager import estimate_tokens, trim_messages
+from .token_manager import estimate_tokens, trim_messages, truncate_tool_content
 from .formatting import (
     print_error,
     print_warning,
@@ -14,12 +14,14 @@ from .formatting import (
     print_info,
     format_risk_warning
 )
-from .helpers import check_file_operation_safety, get_version
+from .helpers import check_file_operation_safety, ensure_parent_dir, file_cache_key, get_version
+from .serialization import json_loads, json_dumps
 
 __all__ = [
     # Token Management
     'estimate_tokens',
     'trim_messages',
+    'truncate_tool_content',
     # Formatting
     'print_error',
     'print_warning',
@@ -28,5 +30,10 @@ __all__ = [
     'format_risk_warning',
     # Helpers
     'check_file_operation_safety',
+    'ensure_parent_dir',
+    'file_cache_key',
     'get_version',
+    # Serialization
+    'json_loads',
+    'json_dumps',
 ]
@@ -6,6 +6,9 @@ General helper functions
 Version: 1.5.2
 """
 
+import os
+import stat
+import time
 from typing import Optional, Tuple
 from pathlib import Path
 
@@ -57,6 +60,46 @@ def check_file_operation_safety(
     return (True, "Operation is safe")
 
 
+def ensure_parent_dir(path: str) -> None:
+    """
+    Creates the parent directory of a path if it does not exist yet.
+
+    Checks with a single stat first; os.makedirs(exist_ok=True) alone
+    needs several syscalls even when the directory already exists.
+    """
+    parent_dir = os.path.dirname(path)
+    if parent_dir and not os.path.isdir(parent_dir):
+        os.makedirs(parent_dir, exist_ok=True)
+
+
+# ============================================================================
+# File Cache Keys
+# ============================================================================
+
+# Files changed more recently than this (seconds) are not cached: file
+# timestamps have a coarse granularity, so a second change of the same
+# size within one tick would otherwise go unnoticed.
+CACHE_MIN_AGE = 2.0
+
+FileCacheKey = Tuple[str, int, int, int, int, int]
+
+
+def file_cache_key(path: str) -> Optional[FileCacheKey]:
+    """
+    Returns a key for caching data read from a file.
+
+    The key changes whenever the file is replaced, written or its
+    permissions change. Returns None for non-regular files and files
+    changed too recently to be cached safely.
+    """
+    st = os.stat(path)
+    if not stat.S_ISREG(st.st_mode):
+        return None
+    if time.time_ns() - max(st.st_mtime_ns, st.st_ctime_ns) < CACHE_MIN_AGE * 1e9:
+        return None
+    return (path, st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns)
+
+
 # ============================================================================
 # Version
 # ============================================================================
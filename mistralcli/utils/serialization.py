@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Mistral CLI - Serialization
+JSON helpers for tool arguments and results (orjson if available)
+
+Version: 1.5.2
+"""
+
+import re
+import json
+from typing import Any
+
+from ..core.config import ORJSON_AVAILABLE
+
+if ORJSON_AVAILABLE:
+    import orjson
+
+# orjson parses integers beyond 64 bit as float; such documents go to json
+_LONG_NUMBER_RE = re.compile(r'\d{20}')
+
+
+# ============================================================================
+# JSON
+# ============================================================================
+
+def json_loads(data: str) -> Any:
+    """
+    Parses JSON, using orjson when available.
+
+    Raises json.JSONDecodeError for invalid input (orjson's error is a
+    subclass of it).
+    """
+    if ORJSON_AVAILABLE and not _LONG_NUMBER_RE.search(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which the json module accepts
+            pass
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Serializes to a compact JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            # Non-string keys (e.g. None for extra CSV fields) as with json
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # Integers beyond 64 bit and other types orjson can't serialize
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
@@ -6,17 +6,56 @@ Functions for estimating and managing token limits
 Version: 1.5.2
 """
 
+from functools import lru_cache
+from typing import Any
+
 from ..core.logging_config import logger
 
 
+# Tool results beyond this many characters are cut before they are added
+# to the chat history (~4000 tokens, half of the default trim budget)
+MAX_TOOL_CONTENT_CHARS = 16_000
+
+
 # ============================================================================
 # Token Management
 # ============================================================================
 
+# BPE encoding used for counting (tiktoken, optional)
+TIKTOKEN_ENCODING = "cl100k_base"
+
+# Loaded encoding; None = not loaded yet, False = unavailable
+_encoding: Any = None
+
+
+def _get_encoding() -> Any:
+    """Loads the tiktoken encoding on first use (False if unavailable)."""
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding(TIKTOKEN_ENCODING)
+        except ImportError:
+            _encoding = False
+        except Exception as e:
+            # e.g. the encoding file could not be downloaded
+            logger.warning(f"tiktoken unavailable, estimating tokens by length: {e}")
+            _encoding = False
+    return _encoding
+
+
+@lru_cache(maxsize=4096)
+def _count_tokens(text: str) -> int:
+    """Counts tokens with tiktoken (cached, the history is re-counted every turn)."""
+    return len(_get_encoding().encode(text, disallowed_special=()))
+
+
 def estimate_tokens(text: str) -> int:
     """
     Estimates the number of tokens in a text.
-    Rough estimate: ~4 characters per token for German/English.
+
+    Uses tiktoken's BPE if installed; otherwise a rough estimate of
+    ~4 characters per token for German/English.
 
     Args:
         text: The text
@@ -24,6 +63,8 @@ def estimate_tokens(text: str) -> int:
     Returns:
         Estimated token count
     """
+    if _get_encoding():
+        return _count_tokens(text)
     return len(text) // 4
 
 
@@ -65,18 +106,24 @@ def trim_messages(
 
     remaining_tokens = max_tokens - system_tokens
 
-    # Add messages from the back (newest first)
+    # Add messages from the back (newest first, reversed at the end)
     trimmed = []
     current_tokens = 0
 
     for msg in reversed(other_messages):
         msg_tokens = estimate_tokens(str(msg.get("content", "")))
         if current_tokens + msg_tokens <= remaining_tokens:
-            trimmed.insert(0, msg)
+            trimmed.append(msg)
             current_tokens += msg_tokens
         else:
             break
 
+    # Tool results whose assistant tool_calls message was cut are invalid
+    # (trimmed is still newest first, so the oldest messages are at the end)
+    while trimmed and trimmed[-1].get("role") == "tool":
+        trimmed.pop()
+    trimmed.reverse()
+
     # Combine system messages with trimmed messages
     result = system_messages + trimmed
 
@@ -84,3 +131,23 @@ def trim_messages(
         logger.info(f"Messages trimmed: {len(messages)} -> {len(result)}")
 
     return result
+
+
+def truncate_tool_content(content: str, max_chars: int = MAX_TOOL_CONTENT_CHARS) -> str:
+    """
+    Cuts a serialized tool result for the chat history.
+
+    The history is sent with every request, so a single large result
+    (e.g. a parsed CSV file) would otherwise be billed again on every
+    turn and push all earlier messages out of the trim budget.
+
+    Args:
+        content: The serialized tool result
+        max_chars: Maximum number of characters kept
+
+    Returns:
+        The content, cut with a note on the removed length if too long
+    """
+    if len(content) <= max_chars:
+        return content
+    return content[:max_chars] + f"... <truncated {len(content) - max_chars} chars>"
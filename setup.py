@@ -34,6 +34,7 @@ setup(
             "paramiko>=3.4.0",    # Für SFTP-Support
             "keyring>=24.0.0",    # Für sichere API-Key-Speicherung
             "cryptography>=41.0.0",  # Für AES-Verschlüsselung
+            "orjson>=3.9.0",      # Schnellere JSON-Serialisierung
         ],
         "sftp": [
             "paramiko>=3.4.0",    # Nur SFTP-Support
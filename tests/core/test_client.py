@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for mistralcli.core.client
+
+Tests the on-disk cache of the model list.
+
+Version: 1.5.2
+"""
+
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+client_module = pytest.importorskip("mistralcli.core.client")
+
+
+# ============================================================================
+# Test list_models
+# ============================================================================
+
+class TestListModels:
+    """Tests for list_models function."""
+
+    @pytest.fixture
+    def patched_client(self, temp_dir: Path, mock_mistral_client):
+        """Serves the mocked client and caches into the temp directory."""
+        with patch.object(client_module, "get_client", return_value=mock_mistral_client), \
+             patch.object(client_module, "_client_key_id", "key-a"), \
+             patch.object(client_module, "MODELS_CACHE_FILE", temp_dir / "models.json"):
+            yield mock_mistral_client
+
+    @pytest.mark.unit
+    def test_second_call_served_from_cache(self, patched_client):
+        """Test that the API is only asked once within the TTL."""
+        first = client_module.list_models()
+        second = client_module.list_models()
+
+        assert first == second == [{"id": "mistral-small-latest", "description": "Fast and efficient model"}]
+        assert patched_client.models.list.call_count == 1
+
+    @pytest.mark.unit
+    def test_refresh_and_other_key_bypass_cache(self, patched_client):
+        """Test that refresh=True and a different API-Key fetch the list again."""
+        client_module.list_models()
+        client_module.list_models(refresh=True)
+        with patch.object(client_module, "_client_key_id", "key-b"):
+            client_module.list_models()
+
+        assert patched_client.models.list.call_count == 3
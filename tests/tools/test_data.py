@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for mistralcli.tools.data
+
+Tests the data processing tools:
+- parse_json
+- parse_csv
+
+Version: 1.5.2
+"""
+
+import pytest
+from unittest.mock import patch
+
+from mistralcli.tools import data
+from mistralcli.utils import helpers
+from mistralcli.tools.data import parse_json, parse_csv
+
+
+# ============================================================================
+# Test parse_json
+# ============================================================================
+
+class TestParseJson:
+    """Tests for parse_json function."""
+
+    @pytest.mark.unit
+    def test_parse_without_query(self):
+        """Test parsing a JSON document."""
+        result = parse_json('{"name": "test", "items": [1, 2, 3]}')
+
+        assert result["success"] is True
+        assert result["data"] == {"name": "test", "items": [1, 2, 3]}
+
+    @pytest.mark.unit
+    def test_query_nested_key_and_index(self):
+        """Test extracting a value with a dotted query."""
+        result = parse_json('{"a": {"b": [10, 20, 30]}}', "a.b.1")
+
+        assert result["success"] is True
+        assert result["data"] == 20
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("query,key", [
+        ("a.missing", "missing"),
+        ("a.b.9", "9"),
+        ("a.b.x", "x"),
+        ("a.b.0.c", "c"),
+    ])
+    def test_query_key_not_found(self, query, key):
+        """Test that unresolvable query steps return an error."""
+        result = parse_json('{"a": {"b": [10, 20, 30]}}', query)
+
+        assert result["success"] is False
+        assert result["error"] == f"Key '{key}' not found"
+
+    @pytest.mark.unit
+    def test_query_compiled_once(self):
+        """Test that repeated queries reuse the compiled steps."""
+        steps = data._compile_query("a.b.0")
+
+        assert steps == (("a", None), ("b", None), ("0", 0))
+        assert data._compile_query("a.b.0") is steps
+
+    @pytest.mark.unit
+    def test_digit_key_in_object(self):
+        """Test that digit keys are looked up as strings in objects."""
+        result = parse_json('{"2024": {"total": 5}}', "2024.total")
+
+        assert result["data"] == 5
+
+    @pytest.mark.unit
+    def test_large_integer_and_nan(self):
+        """Test documents outside orjson's range fall back to the json module."""
+        result = parse_json('{"big": 123456789012345678901234567890, "x": NaN}', "big")
+
+        assert result["success"] is True
+        assert result["data"] == 123456789012345678901234567890
+
+    @pytest.mark.unit
+    def test_invalid_json(self):
+        """Test that invalid JSON returns an error."""
+        result = parse_json("{invalid")
+
+        assert result["success"] is False
+        assert "error" in result
+
+
+# ============================================================================
+# Test parse_csv
+# ============================================================================
+
+class TestParseCsv:
+    """Tests for parse_csv function."""
+
+    @pytest.mark.unit
+    def test_parse_csv(self, sample_csv_file):
+        """Test parsing a CSV file into row dictionaries."""
+        result = parse_csv(str(sample_csv_file))
+
+        assert result["success"] is True
+        assert result["columns"] == ["name", "age", "city"]
+        assert result["num_rows"] == 2
+        assert result["truncated"] is False
+        assert result["data"] == [
+            {"name": "Alice", "age": "30", "city": "Berlin"},
+            {"name": "Bob", "age": "25", "city": "Munich"},
+        ]
+
+    @pytest.mark.unit
+    def test_parse_cached_until_changed(self, sample_csv_file):
+        """Test that unchanged files are parsed once per delimiter."""
+        with patch.object(helpers, "CACHE_MIN_AGE", 0):
+            first = parse_csv(str(sample_csv_file))
+            hits = data._read_csv_cached.cache_info().hits
+            second = parse_csv(str(sample_csv_file))
+
+            assert data._read_csv_cached.cache_info().hits == hits + 1
+            assert second == first
+
+            sample_csv_file.write_text("x,y\n1,2\n")
+            assert parse_csv(str(sample_csv_file))["data"] == [{"x": "1", "y": "2"}]
+
+    @pytest.mark.unit
+    def test_custom_delimiter(self, temp_dir):
+        """Test parsing with a custom delimiter."""
+        csv_file = temp_dir / "semicolon.csv"
+        csv_file.write_text("a;b\n1;2\n")
+
+        result = parse_csv(str(csv_file), delimiter=";")
+
+        assert result["data"] == [{"a": "1", "b": "2"}]
+
+    @pytest.mark.unit
+    def test_irregular_rows(self, temp_dir):
+        """Test blank, short and long rows (same semantics as csv.DictReader)."""
+        csv_file = temp_dir / "irregular.csv"
+        csv_file.write_text("a,b\n1\n\n1,2,3\n")
+
+        result = parse_csv(str(csv_file))
+
+        assert result["num_rows"] == 2
+        assert result["data"] == [
+            {"a": "1", "b": None},
+            {"a": "1", "b": "2", None: ["3"]},
+        ]
+
+    @pytest.mark.unit
+    def test_quoted_newline(self, temp_dir):
+        """Test that newlines inside quoted fields are preserved."""
+        csv_file = temp_dir / "quoted.csv"
+        csv_file.write_bytes(b'a,b\r\n"line1\r\nline2",x\r\n')
+
+        result = parse_csv(str(csv_file))
+
+        assert result["data"] == [{"a": "line1\r\nline2", "b": "x"}]
+
+    @pytest.mark.unit
+    def test_row_limit(self, temp_dir):
+        """Test that returned rows are capped while all rows are counted."""
+        csv_file = temp_dir / "large.csv"
+        csv_file.write_text("n\n" + "".join(f"{i}\n" for i in range(25)))
+
+        with patch.object(data, "MAX_CSV_ROWS", 10):
+            result = parse_csv(str(csv_file))
+
+        assert result["success"] is True
+        assert result["num_rows"] == 25
+        assert len(result["data"]) == 10
+        assert result["truncated"] is True
+
+    @pytest.mark.unit
+    def test_header_only(self, temp_dir):
+        """Test a CSV file without data rows."""
+        csv_file = temp_dir / "header.csv"
+        csv_file.write_text("a,b\n")
+
+        result = parse_csv(str(csv_file))
+
+        assert result["data"] == []
+        assert result["columns"] == ["a", "b"]
+
+    @pytest.mark.unit
+    def test_arrow_matches_csv_module(self, temp_dir):
+        """Test that the pyarrow reader returns the same rows as the csv module."""
+        pytest.importorskip("pyarrow")
+        csv_file = temp_dir / "values.csv"
+        csv_file.write_text('id,value,note\n1,,"a, b"\n2,3.5,\n\n007,x,"say ""hi"""\n')
+
+        assert data._read_csv_arrow(str(csv_file), ",") == data._read_csv_rows(str(csv_file), ",")
+
+    @pytest.mark.unit
+    def test_arrow_falls_back_on_ragged_rows(self, temp_dir):
+        """Test that files pyarrow rejects are left to the csv module."""
+        pytest.importorskip("pyarrow")
+        csv_file = temp_dir / "ragged.csv"
+        csv_file.write_text("a,b\n1\n")
+
+        assert data._read_csv_arrow(str(csv_file), ",") is None
+
+    @pytest.mark.unit
+    def test_missing_file(self, temp_dir):
+        """Test that a missing file returns an error."""
+        result = parse_csv(str(temp_dir / "missing.csv"))
+
+        assert result["success"] is False
+        assert "not found" in result["error"].lower()
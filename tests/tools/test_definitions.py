@@ -7,13 +7,16 @@ Tests the TOOLS array and tool definitions for:
 - Required fields
 - Valid JSON schemas
 - Complete tool coverage
+- Parity with the tool function signatures
 
 Version: 1.5.2
 """
 
 import pytest
 import json
-from mistralcli.tools.definitions import TOOLS
+import inspect
+from mistralcli import tools
+from mistralcli.tools.definitions import TOOLS, TOOLS_BY_NAME
 
 
 # ============================================================================
@@ -24,9 +27,9 @@ class TestToolsArrayStructure:
     """Tests for the TOOLS array structure."""
 
     @pytest.mark.unit
-    def test_tools_is_list(self):
-        """Test that TOOLS is a list."""
-        assert isinstance(TOOLS, list)
+    def test_tools_is_tuple(self):
+        """Test that TOOLS is an immutable tuple."""
+        assert isinstance(TOOLS, tuple)
 
     @pytest.mark.unit
     def test_tools_not_empty(self):
@@ -138,6 +141,13 @@ class TestToolNames:
             assert ' ' not in name, f"Tool name '{name}' contains spaces"
             assert name.replace('_', '').isalnum(), f"Tool name '{name}' contains invalid characters"
 
+    @pytest.mark.unit
+    def test_tools_by_name_index(self):
+        """Test that TOOLS_BY_NAME maps every tool name to its definition."""
+        assert len(TOOLS_BY_NAME) == len(TOOLS)
+        for tool in TOOLS:
+            assert TOOLS_BY_NAME[tool["function"]["name"]] is tool
+
 
 # ============================================================================
 # Test Parameter Schemas
@@ -278,6 +288,39 @@ class TestSpecificTools:
             assert params["port"]["default"] == 22
 
 
+# ============================================================================
+# Test Schema/Implementation Parity
+# ============================================================================
+
+class TestSignatureParity:
+    """Tests that the schemas match the tool function signatures."""
+
+    @staticmethod
+    def _signature(tool_name):
+        parameters = inspect.signature(getattr(tools, tool_name)).parameters
+        return {name: p for name, p in parameters.items() if name != "auto_confirm"}
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("tool_name", list(TOOLS_BY_NAME))
+    def test_properties_match_parameters(self, tool_name):
+        """Test that every schema property is a function parameter and vice versa."""
+        properties = TOOLS_BY_NAME[tool_name]["function"]["parameters"]["properties"]
+
+        assert set(properties) == set(self._signature(tool_name))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("tool_name", list(TOOLS_BY_NAME))
+    def test_schema_defaults_match_function_defaults(self, tool_name):
+        """Test that documented defaults agree with the function's defaults."""
+        properties = TOOLS_BY_NAME[tool_name]["function"]["parameters"]["properties"]
+        signature = self._signature(tool_name)
+
+        for name, spec in properties.items():
+            # Parameters without a function default get it from the executor
+            if "default" in spec and signature[name].default is not inspect.Parameter.empty:
+                assert signature[name].default == spec["default"], name
+
+
 # ============================================================================
 # Test JSON Validity
 # ============================================================================
@@ -301,7 +344,7 @@ class TestJSONValidity:
         deserialized = json.loads(json_str)
 
         assert len(deserialized) == len(TOOLS)
-        assert deserialized == TOOLS
+        assert deserialized == list(TOOLS)
 
 
 # ============================================================================
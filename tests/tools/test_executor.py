@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for mistralcli.tools.executor
+
+Tests the tool dispatcher:
+- Handler coverage for all tool definitions
+- Argument mapping
+- Unknown tools
+
+Version: 1.5.2
+"""
+
+import threading
+import pytest
+from unittest.mock import patch
+
+from mistralcli.tools import executor
+from mistralcli.tools.definitions import TOOLS
+from mistralcli.tools.executor import execute_tool, execute_tools_batch
+
+
+# ============================================================================
+# Test Dispatcher
+# ============================================================================
+
+class TestExecuteTool:
+    """Tests for execute_tool function."""
+
+    @pytest.mark.unit
+    def test_every_tool_has_handler(self):
+        """Test that every defined tool can be dispatched."""
+        tool_names = {tool["function"]["name"] for tool in TOOLS}
+        assert tool_names == set(executor._TOOL_HANDLERS)
+
+    @pytest.mark.unit
+    def test_unknown_tool(self):
+        """Test that unknown tools return an error result."""
+        result = execute_tool("does_not_exist", {})
+
+        assert result["success"] is False
+        assert "Unknown tool" in result["error"]
+
+    @pytest.mark.unit
+    def test_arguments_mapped(self):
+        """Test that tool arguments and defaults are passed to the tool."""
+        with patch.object(executor, "search_web", return_value={"success": True}) as mock_search:
+            result = execute_tool("search_web", {"query": "python"})
+
+        assert result == {"success": True}
+        mock_search.assert_called_once_with("python", 5)
+
+    @pytest.mark.unit
+    def test_auto_confirm_passed(self):
+        """Test that auto_confirm is forwarded to confirming tools."""
+        with patch.object(executor, "write_file", return_value={"success": True}) as mock_write:
+            execute_tool("write_file", {"file_path": "a.txt", "content": "x"}, auto_confirm=True)
+
+        mock_write.assert_called_once_with("a.txt", "x", True)
+
+
+# ============================================================================
+# Test Argument Validation
+# ============================================================================
+
+class TestArgumentValidation:
+    """Tests for the compiled argument validators."""
+
+    @pytest.mark.unit
+    def test_every_tool_has_validator(self):
+        """Test that a validator is compiled for every tool."""
+        assert set(executor._VALIDATORS) == {tool["function"]["name"] for tool in TOOLS}
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("tool_name,args,error", [
+        ("read_file", {}, "Missing required argument 'file_path'"),
+        ("read_file", {"file_path": None}, "Missing required argument 'file_path'"),
+        ("read_file", {"file_path": 42}, "Argument 'file_path' must be of type string"),
+        ("search_web", {"query": "x", "num_results": "5"}, "Argument 'num_results' must be of type integer"),
+        ("search_web", {"query": "x", "num_results": True}, "Argument 'num_results' must be of type integer"),
+        ("fetch_url", {"url": "https://x", "method": "PUT"}, "Argument 'method' must be one of: GET, POST"),
+    ])
+    def test_invalid_arguments_rejected(self, tool_name, args, error):
+        """Test that invalid arguments are reported without calling the tool."""
+        with patch.dict(executor._TOOL_HANDLERS, {tool_name: lambda *a: pytest.fail("tool called")}):
+            result = execute_tool(tool_name, args)
+
+        assert result["success"] is False
+        assert result["error"] == f"Invalid arguments for {tool_name}: {error}"
+
+    @pytest.mark.unit
+    def test_optional_null_accepted(self):
+        """Test that optional arguments may be null."""
+        with patch.object(executor, "upload_ftp", return_value={"success": True}) as mock_upload:
+            result = execute_tool("upload_ftp", {
+                "local_file": "a.txt", "host": "h", "remote_path": "/a.txt", "username": None,
+            })
+
+        assert result == {"success": True}
+        mock_upload.assert_called_once()
+
+    @pytest.mark.unit
+    def test_optional_null_uses_default(self):
+        """Test that a null optional argument is dropped so the tool default applies."""
+        with patch.object(executor, "search_web", return_value={"success": True}) as mock_search:
+            result = execute_tool("search_web", {"query": "x", "num_results": None})
+
+        assert result == {"success": True}
+        mock_search.assert_called_once_with("x", 5)
+
+    @pytest.mark.unit
+    def test_non_object_arguments(self):
+        """Test that non-object arguments are rejected."""
+        result = execute_tool("read_file", ["a.txt"])
+
+        assert result["success"] is False
+
+
+# ============================================================================
+# Test execute_tools_batch
+# ============================================================================
+
+class TestExecuteToolsBatch:
+    """Tests for execute_tools_batch function."""
+
+    @pytest.mark.unit
+    def test_read_only_calls_run_concurrently(self):
+        """Test that read-only tools overlap and results keep call order."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_parse_json(json_string, query=None):
+            barrier.wait()  # Deadlocks (times out) unless both calls run at once
+            return {"success": True, "data": json_string}
+
+        with patch.object(executor, "parse_json", fake_parse_json):
+            results = execute_tools_batch([
+                ("parse_json", {"json_string": "1"}),
+                ("parse_json", {"json_string": "2"}),
+            ])
+
+        assert [r["data"] for r in results] == ["1", "2"]
+
+    @pytest.mark.unit
+    def test_side_effects_run_sequentially(self):
+        """Test that a batch with a writing tool runs in call order on the caller thread."""
+        order = []
+
+        def record(name):
+            def tool(*args):
+                order.append((name, threading.current_thread()))
+                return {"success": True}
+            return tool
+
+        with patch.object(executor, "write_file", record("write")), \
+             patch.object(executor, "read_file", record("read")):
+            execute_tools_batch([
+                ("write_file", {"file_path": "a.txt", "content": "x"}),
+                ("read_file", {"file_path": "a.txt"}),
+            ], auto_confirm=True)
+
+        assert [name for name, _ in order] == ["write", "read"]
+        assert all(thread is threading.current_thread() for _, thread in order)
+
@@ -12,14 +12,21 @@ Tests all filesystem tool functions:
 Version: 1.5.2
 """
 
+import errno
+import os
 import pytest
 from pathlib import Path
+from unittest.mock import patch
+from mistralcli.tools import filesystem
+from mistralcli.utils import helpers
 from mistralcli.tools.filesystem import (
     read_file,
     write_file,
     rename_file,
     copy_file,
     move_file,
+    _content_preview,
+    PREVIEW_CHARS,
 )
 
 
@@ -96,6 +103,82 @@ class TestReadFile:
         else:
             assert "error" in result
 
+    @pytest.mark.unit
+    def test_read_crlf_newlines(self, temp_dir):
+        """Test that Windows and old Mac newlines are normalized."""
+        crlf_file = temp_dir / "crlf.txt"
+        crlf_file.write_bytes(b"a\r\nb\rc\n")
+
+        result = read_file(str(crlf_file))
+
+        assert result["content"] == "a\nb\nc\n"
+
+    @pytest.mark.unit
+    def test_read_large_file_truncated(self, temp_dir):
+        """Test that files above MAX_READ_BYTES are cut on a character boundary."""
+        large_file = temp_dir / "large.txt"
+        large_file.write_text("ä" * 100, encoding='utf-8')
+
+        with patch.object(filesystem, "MMAP_THRESHOLD", 50), \
+             patch.object(filesystem, "MAX_READ_BYTES", 51):
+            result = read_file(str(large_file))
+
+        assert result["success"] is True
+        assert result["truncated"] is True
+        assert result["content"] == "ä" * 25
+
+    @pytest.mark.unit
+    def test_read_mapped_file_complete(self, temp_dir):
+        """Test that files read through mmap below MAX_READ_BYTES are returned whole."""
+        large_file = temp_dir / "large.txt"
+        large_file.write_bytes("ä\r\n".encode('utf-8') * 100)
+
+        with patch.object(filesystem, "MMAP_THRESHOLD", 50):
+            result = read_file(str(large_file))
+
+        assert result["success"] is True
+        assert "truncated" not in result
+        assert result["content"] == "ä\n" * 100
+
+    @pytest.mark.unit
+    def test_read_short_reads(self, sample_text_file):
+        """Test that the whole file is read when os.read returns less than asked."""
+        real_read = os.read
+
+        with patch.object(filesystem.os, "read", lambda fd, n: real_read(fd, min(n, 4))):
+            result = read_file(str(sample_text_file))
+
+        assert result["content"] == sample_text_file.read_text()
+
+    @pytest.mark.unit
+    @pytest.mark.skipif(not os.path.exists("/proc/self/status"), reason="requires procfs")
+    def test_read_procfs_file(self):
+        """Test that files reporting size 0 (procfs) are read to the end."""
+        content, truncated = filesystem._read_text("/proc/self/status")
+
+        assert os.stat("/proc/self/status").st_size == 0
+        assert content.startswith("Name:")
+        assert truncated is False
+
+    @pytest.mark.unit
+    def test_read_cached_until_changed(self, sample_text_file):
+        """Test that unchanged files are served from the cache and changes are seen."""
+        with patch.object(helpers, "CACHE_MIN_AGE", 0):
+            first = read_file(str(sample_text_file))
+            hits = filesystem._read_text_cached.cache_info().hits
+            second = read_file(str(sample_text_file))
+
+            assert filesystem._read_text_cached.cache_info().hits == hits + 1
+            assert second == first
+
+            sample_text_file.write_text("changed")
+            assert read_file(str(sample_text_file))["content"] == "changed"
+
+    @pytest.mark.unit
+    def test_recently_changed_file_not_cached(self, sample_text_file):
+        """Test that files changed within CACHE_MIN_AGE get no cache key."""
+        assert helpers.file_cache_key(str(sample_text_file)) is None
+
 
 # ============================================================================
 # Test write_file
@@ -126,6 +209,26 @@ class TestWriteFile:
         assert result["success"] is True
         assert sample_text_file.read_text() == new_content
 
+    @pytest.mark.unit
+    def test_write_truncates_and_encodes(self, sample_text_file):
+        """Test that shorter content replaces the file and is written as UTF-8."""
+        result = write_file(str(sample_text_file), "Grüße\n", auto_confirm=True)
+
+        assert result["success"] is True
+        assert sample_text_file.read_bytes() == "Grüße\n".encode("utf-8")
+
+    @pytest.mark.unit
+    def test_write_partial_writes_completed(self, temp_dir):
+        """Test that short os.write calls are continued until all data is written."""
+        new_file = temp_dir / "partial.txt"
+        write = filesystem.os.write
+
+        with patch.object(filesystem.os, "write", lambda fd, data: write(fd, data[:3])):
+            result = write_file(str(new_file), "abcdefghij", auto_confirm=True)
+
+        assert result["success"] is True
+        assert new_file.read_text() == "abcdefghij"
+
     @pytest.mark.unit
     @pytest.mark.security
     def test_write_system_file_blocked(self):
@@ -177,6 +280,16 @@ class TestWriteFile:
         if result["success"]:
             assert nested_file.exists()
 
+    @pytest.mark.unit
+    def test_content_preview(self):
+        """Test that the preview is cut, kept on one line and skips binary."""
+        long_content = "x" * (PREVIEW_CHARS * 1000)
+
+        assert _content_preview("short") == "short"
+        assert _content_preview("a\nb") == "a\\nb"
+        assert _content_preview(long_content) == "x" * PREVIEW_CHARS + "..."
+        assert _content_preview("\x00\x01data") == "<binary, 6 characters>"
+
 
 # ============================================================================
 # Test rename_file
@@ -284,6 +397,60 @@ class TestCopyFile:
             assert dest_dir.exists()
             assert (dest_dir / "file.txt").exists()
 
+    @pytest.mark.unit
+    def test_copy_keeps_metadata(self, sample_text_file, temp_dir):
+        """Test that content, mode and mtime are copied like shutil.copy2."""
+        sample_text_file.chmod(0o640)
+        filesystem.os.utime(sample_text_file, (1_000_000_000, 1_000_000_000))
+        destination = temp_dir / "copied.txt"
+
+        result = copy_file(str(sample_text_file), str(destination), auto_confirm=True)
+
+        assert result["success"] is True
+        assert destination.read_bytes() == sample_text_file.read_bytes()
+        assert destination.stat().st_mode == sample_text_file.stat().st_mode
+        assert destination.stat().st_mtime == 1_000_000_000
+
+    @pytest.mark.unit
+    def test_copy_falls_back_without_copy_file_range(self, sample_text_file, temp_dir):
+        """Test that an unsupported copy_file_range falls back to a normal copy."""
+        destination = temp_dir / "copied.txt"
+
+        def unsupported(*args):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        with patch.object(filesystem.os, "copy_file_range", unsupported, create=True):
+            result = copy_file(str(sample_text_file), str(destination), auto_confirm=True)
+
+        assert result["success"] is True
+        assert destination.read_text() == sample_text_file.read_text()
+
+    @pytest.mark.unit
+    def test_copy_falls_back_on_short_copy_file_range(self, sample_text_file, temp_dir):
+        """Test that copy_file_range stopping before the end falls back to a normal copy."""
+        destination = temp_dir / "copied.txt"
+
+        def stops_early(src, dst, count):
+            # Copies a few bytes, then reports 0 as if the end was reached
+            return os.write(dst, os.read(src, 5)) if os.lseek(dst, 0, os.SEEK_CUR) == 0 else 0
+
+        with patch.object(filesystem.os, "copy_file_range", stops_early, create=True):
+            result = copy_file(str(sample_text_file), str(destination), auto_confirm=True)
+
+        assert result["success"] is True
+        assert destination.read_text() == sample_text_file.read_text()
+
+    @pytest.mark.unit
+    def test_copy_into_directory(self, sample_text_file, temp_dir):
+        """Test that copying onto a directory places the file inside it."""
+        target = temp_dir / "target"
+        target.mkdir()
+
+        result = copy_file(str(sample_text_file), str(target), auto_confirm=True)
+
+        assert result["success"] is True
+        assert (target / sample_text_file.name).read_text() == sample_text_file.read_text()
+
     @pytest.mark.unit
     @pytest.mark.security
     def test_copy_to_system_location_blocked(self, sample_text_file):
@@ -338,6 +505,35 @@ class TestMoveFile:
         assert result["success"] is True
         assert destination.read_text() == original_content
 
+    @pytest.mark.unit
+    def test_move_into_existing_directory(self, sample_text_file, temp_dir):
+        """Test that moving onto a directory places the file inside it."""
+        new_dir = temp_dir / "target"
+        new_dir.mkdir()
+
+        result = move_file(str(sample_text_file), str(new_dir), auto_confirm=True)
+
+        assert result["success"] is True
+        assert (new_dir / sample_text_file.name).exists()
+
+    @pytest.mark.unit
+    def test_move_across_devices(self, sample_text_file, temp_dir):
+        """Test that a cross-device rename falls back to copy and delete."""
+        destination = temp_dir / "moved.txt"
+        rename = filesystem.os.rename
+
+        def fake_rename(src, dst):
+            if src == str(sample_text_file):
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            rename(src, dst)
+
+        with patch.object(filesystem.os, "rename", fake_rename):
+            result = move_file(str(sample_text_file), str(destination), auto_confirm=True)
+
+        assert result["success"] is True
+        assert not sample_text_file.exists()
+        assert destination.read_text() == "Hello World\nThis is a test file.\n"
+
     @pytest.mark.unit
     @pytest.mark.security
     def test_move_to_system_location_blocked(self, sample_text_file):
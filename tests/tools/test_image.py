@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for mistralcli.tools.image
+
+Tests get_image_info with hand-built PNG/JPEG headers, so no PIL is
+needed.
+
+Version: 1.5.2
+"""
+
+import struct
+import zlib
+import pytest
+from pathlib import Path
+from unittest.mock import patch
+
+from mistralcli.tools import image as image_module, reset_caches
+from mistralcli.tools.image import get_image_info
+from mistralcli.utils import helpers
+
+
+# ============================================================================
+# Helpers
+# ============================================================================
+
+def _png_bytes(width: int, height: int, color_type: int = 2, depth: int = 8) -> bytes:
+    """Builds a PNG signature and IHDR chunk."""
+    ihdr = struct.pack('>IIBBBBB', width, height, depth, color_type, 0, 0, 0)
+    chunk = b'IHDR' + ihdr
+    return (
+        b'\x89PNG\r\n\x1a\n'
+        + struct.pack('>I', len(ihdr)) + chunk
+        + struct.pack('>I', zlib.crc32(chunk))
+    )
+
+
+def _jpeg_bytes(width: int, height: int, components: int = 3) -> bytes:
+    """Builds a JPEG SOI, an APP0 segment and a baseline SOF0 header."""
+    app0 = b'JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00'
+    sof = struct.pack('>BHHB', 8, height, width, components) + b'\x01\x11\x00' * components
+    return (
+        b'\xff\xd8'
+        + b'\xff\xe0' + struct.pack('>H', len(app0) + 2) + app0
+        + b'\xff\xc0' + struct.pack('>H', len(sof) + 2) + sof
+    )
+
+
+# ============================================================================
+# Test get_image_info
+# ============================================================================
+
+class TestGetImageInfo:
+    """Tests for get_image_info function."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("color_type,mode", [(2, "RGB"), (6, "RGBA"), (0, "L"), (3, "P")])
+    def test_png_header(self, temp_dir: Path, color_type, mode):
+        """Test that PNG format, mode and size come from the IHDR chunk."""
+        image = temp_dir / "image.png"
+        image.write_bytes(_png_bytes(640, 480, color_type))
+
+        result = get_image_info(str(image))
+
+        assert result["success"] is True
+        assert result["format"] == "PNG"
+        assert result["mode"] == mode
+        assert result["size"] == (640, 480)
+        assert result["width"] == 640
+        assert result["height"] == 480
+        assert result["file_size"] == image.stat().st_size
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("components,mode", [(1, "L"), (3, "RGB"), (4, "CMYK")])
+    def test_jpeg_header(self, temp_dir: Path, components, mode):
+        """Test that JPEG size is read from the SOF segment after APP0."""
+        image = temp_dir / "image.jpg"
+        image.write_bytes(_jpeg_bytes(1920, 1080, components))
+
+        result = get_image_info(str(image))
+
+        assert result["success"] is True
+        assert result["format"] == "JPEG"
+        assert result["mode"] == mode
+        assert result["size"] == (1920, 1080)
+
+    @pytest.mark.unit
+    def test_truncated_jpeg_not_guessed(self, temp_dir: Path):
+        """Test that a JPEG without a frame header is not reported with a size."""
+        image = temp_dir / "broken.jpg"
+        image.write_bytes(b'\xff\xd8\xff\xe0\x00')
+
+        result = get_image_info(str(image))
+
+        assert "width" not in result
+
+    @pytest.mark.unit
+    def test_missing_file(self, temp_dir: Path):
+        """Test that a missing image returns an error."""
+        result = get_image_info(str(temp_dir / "missing.png"))
+
+        assert result["success"] is False
+        assert result["error"] == "File not found"
+
+    @pytest.mark.unit
+    def test_cached_until_changed(self, temp_dir: Path):
+        """Test that unchanged images are analyzed once and changes are seen."""
+        image = temp_dir / "image.png"
+        image.write_bytes(_png_bytes(640, 480))
+
+        with patch.object(helpers, "CACHE_MIN_AGE", 0):
+            first = get_image_info(str(image))
+            hits = image_module._read_image_info_cached.cache_info().hits
+            second = get_image_info(str(image))
+
+            assert image_module._read_image_info_cached.cache_info().hits == hits + 1
+            assert second == first
+
+            image.write_bytes(_png_bytes(32, 16))
+            assert get_image_info(str(image))["size"] == (32, 16)
+
+        reset_caches()
+        assert image_module._read_image_info_cached.cache_info().currsize == 0
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for mistralcli.tools.network
+
+Tests the network helpers:
+- Keep-alive connection pool
+- Error mapping (HTTPError/URLError)
+- fetch_url read limit
+- download_file streaming
+- search_web result parsing
+
+The public tools validate URLs and block localhost, so the pool is
+tested directly against a local HTTP server.
+
+Version: 1.5.2
+"""
+
+import io
+import sys
+import threading
+import pytest
+from contextlib import contextmanager
+from unittest.mock import patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.error import HTTPError, URLError
+
+from mistralcli.tools import network
+
+
+# ============================================================================
+# Local Test Server
+# ============================================================================
+
+class _Handler(BaseHTTPRequestHandler):
+    """Keep-alive handler that records the client port of every request."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.server.client_ports.append(self.client_address[1])
+        if self.path == "/missing":
+            body = b"not found"
+            self.send_response(404)
+        elif self.path == "/search":
+            body = SEARCH_HTML.encode("utf-8")
+            self.send_response(200)
+        elif self.path == "/redirect":
+            body = b""
+            self.send_response(302)
+            self.send_header("Location", "/hello")
+        else:
+            body = b"hello world"
+            self.send_response(200)
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def http_server():
+    """Starts a local keep-alive HTTP server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.client_ports = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    network._close_idle_connections()
+    server.shutdown()
+    server.server_close()
+
+
+def _url(server, path="/hello"):
+    host, port = server.server_address
+    return f"http://{host}:{port}{path}"
+
+
+# ============================================================================
+# Test Connection Pool
+# ============================================================================
+
+class TestConnectionPool:
+    """Tests for the keep-alive connection pool."""
+
+    @pytest.mark.unit
+    @pytest.mark.network
+    def test_response_content(self, http_server):
+        """Test that the pooled response behaves like urlopen's."""
+        with network._open_url(_url(http_server)) as response:
+            assert response.status == 200
+            assert response.headers.get("Content-Type") == "text/plain"
+            assert response.read() == b"hello world"
+
+    @pytest.mark.unit
+    @pytest.mark.network
+    def test_connection_reused(self, http_server):
+        """Test that sequential requests reuse the same TCP connection."""
+        for _ in range(3):
+            with network._open_url(_url(http_server)) as response:
+                response.read()
+
+        assert len(http_server.client_ports) == 3
+        assert len(set(http_server.client_ports)) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.network
+    def test_partial_read_not_reused(self, http_server):
+        """Test that a connection with unread body is not returned to the pool."""
+        with network._open_url(_url(http_server)) as response:
+            response.read(1)
+        with network._open_url(_url(http_server)) as response:
+            response.read()
+
+        assert len(set(http_server.client_ports)) == 2
+
+    @pytest.mark.unit
+    @pytest.mark.network
+    def test_search_page_connection_reused(self, http_server):
+        """Test that a search page read only up to the needed results keeps the connection."""
+        with patch.object(network, "SEARCH_READ_CHUNK", 64):
+            with network._open_url(_url(http_server, "/search")) as response:
+                network._read_search_page(response, 1)
+        with network._open_url(_url(http_server)) as response:
+            response.read()
+
+        assert len(set(http_server.client_ports)) == 1
+
+    @pytest.mark.unit
+    @pytest.mark.network
+    def test_http_error_raised(self, http_server):
+        """Test that error status codes raise HTTPError."""
+        with pytest.raises(HTTPError) as exc_info:
+            with network._open_url(_url(http_server, "/missing")):
+                pass
+
+        assert exc_info.value.code == 404
+
+    @pytest.mark.unit
+    @pytest.mark.network
+    @pytest.mark.security
+    def test_redirect_to_localhost_blocked(self, http_server):
+        """Test that redirect targets are validated."""
+        with pytest.raises(URLError) as exc_info:
+            with network._open_url(_url(http_server, "/redirect")):
+                pass
+
+        assert "Redirect blocked" in str(exc_info.value.reason)
+
+    @pytest.mark.unit
+    def test_connection_error_raises_url_error(self):
+        """Test that connection failures are raised as URLError."""
+        with patch.object(network, "_RETRY_BACKOFF", 0):
+            with pytest.raises(URLError):
+                with network._open_url("http://127.0.0.1:1/"):
+                    pass
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("method,attempts", [("GET", 3), ("POST", 1)])
+    def test_connection_errors_retried_for_idempotent_methods(self, method, attempts):
+        """Test that GET is retried after connection errors, POST is not."""
+        calls = []
+
+        def refuse(*args):
+            calls.append(args)
+            raise ConnectionRefusedError()
+
+        with patch.object(network, "_send_request", refuse), \
+             patch.object(network, "_RETRY_BACKOFF", 0):
+            with pytest.raises(URLError):
+                with network._open_url("http://127.0.0.1:1/", method):
+                    pass
+
+        assert len(calls) == attempts
+
+
+# ============================================================================
+# Fake Responses
+# ============================================================================
+
+class _FakeResponse(io.BytesIO):
+    """In-memory response with urlopen-style headers."""
+
+    def __init__(self, body: bytes, headers=None):
+        super().__init__(body)
+        self.headers = headers or {}
+        self.status = 200
+
+
+@contextmanager
+def _fake_open_url(body, response_headers=None):
+    """Patches _open_url to serve a fixed body."""
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+
+    @contextmanager
+    def fake(url, method="GET", headers=None):
+        yield _FakeResponse(body, response_headers)
+
+    with patch.object(network, "_open_url", fake):
+        yield
+
+
+# ============================================================================
+# Test fetch_url
+# ============================================================================
+
+class TestFetchUrl:
+    """Tests for fetch_url function."""
+
+    @pytest.mark.unit
+    def test_small_body_not_truncated(self):
+        """Test that short responses are returned unchanged."""
+        with _fake_open_url("hello", {"Content-Type": "text/plain"}):
+            result = network.fetch_url("https://example.com/")
+
+        assert result["success"] is True
+        assert result["content"] == "hello"
+        assert result["content_type"] == "text/plain"
+        assert result["status_code"] == 200
+
+    @pytest.mark.unit
+    def test_large_body_truncated(self):
+        """Test that long responses are cut to MAX_FETCH_CHARS characters."""
+        body = "a" * (network.MAX_FETCH_CHARS * 10)
+        with _fake_open_url(body):
+            result = network.fetch_url("https://example.com/")
+
+        assert result["success"] is True
+        assert result["content"] == "a" * network.MAX_FETCH_CHARS + "\n... (truncated)"
+
+    @pytest.mark.unit
+    def test_cached_content_revalidated(self):
+        """Test that cached GETs send the validators and reuse the content on 304."""
+        cache = {}
+        sent_headers = []
+        responses = [
+            (b"cached body", 200, {"Content-Type": "text/plain", "ETag": '"v1"'}),
+            (b"", 304, {}),
+        ]
+
+        @contextmanager
+        def fake(url, method="GET", headers=None):
+            sent_headers.append(headers)
+            body, status, response_headers = responses.pop(0)
+            response = _FakeResponse(body, response_headers)
+            response.status = status
+            yield response
+
+        with patch.object(network, "_open_url", fake), \
+             patch.object(network, "_get_url_cache", lambda: cache):
+            first = network.fetch_url("https://example.com/")
+            second = network.fetch_url("https://example.com/")
+
+        assert "If-None-Match" not in sent_headers[0]
+        assert sent_headers[1]["If-None-Match"] == '"v1"'
+        assert second == first
+        assert second["content"] == "cached body"
+
+    @pytest.mark.unit
+    def test_empty_url_cache_returned(self, temp_dir):
+        """Test that a freshly opened, still empty cache is returned (not None)."""
+
+        class _EmptyCache(dict):
+            def __init__(self, directory, size_limit):
+                super().__init__()
+
+        fake_diskcache = type(sys)("diskcache")
+        fake_diskcache.Cache = _EmptyCache
+
+        with patch.dict(sys.modules, {"diskcache": fake_diskcache}), \
+             patch.object(network, "_url_cache", None), \
+             patch.object(network, "URL_CACHE_DIR", temp_dir):
+            cache = network._get_url_cache()
+
+            assert isinstance(cache, _EmptyCache)
+            assert len(cache) == 0
+
+            with _fake_open_url("body", {"ETag": '"v1"'}):
+                network.fetch_url("https://example.com/")
+
+            assert cache["https://example.com/"]["content"] == "body"
+
+    @pytest.mark.unit
+    def test_multibyte_boundary(self):
+        """Test that a character split by the read limit is dropped, not garbled."""
+        raw = "aä".encode("utf-8")[:2]
+        assert network._decode_utf8_prefix(raw) == "a"
+        assert network._decode_utf8_prefix("aä".encode("utf-8")) == "aä"
+
+
+# ============================================================================
+# Test download_file
+# ============================================================================
+
+class TestDownloadFile:
+    """Tests for download_file function."""
+
+    @pytest.mark.unit
+    def test_download_streams_to_destination(self, temp_dir):
+        """Test that the body is written to the destination in chunks."""
+        body = b"x" * 2500
+        dest = temp_dir / "sub" / "file.bin"
+
+        with _fake_open_url(body), patch.object(network, "DOWNLOAD_CHUNK_SIZE", 1000):
+            result = network.download_file("https://example.com/file.bin", str(dest), auto_confirm=True)
+
+        assert result["success"] is True
+        assert result["file_size"] == 2500
+        assert dest.read_bytes() == body
+        assert not (temp_dir / "sub" / "file.bin.part").exists()
+
+    @pytest.mark.unit
+    def test_download_rejected_by_content_length(self, temp_dir):
+        """Test that an oversized Content-Length is rejected before reading."""
+        dest = temp_dir / "file.bin"
+        headers = {"Content-Length": str(200 * 1024 * 1024)}
+
+        with _fake_open_url(b"", headers):
+            result = network.download_file("https://example.com/file.bin", str(dest), auto_confirm=True)
+
+        assert result["success"] is False
+        assert "too large" in result["error"]
+        assert not dest.exists()
+
+    @pytest.mark.unit
+    def test_download_too_large_keeps_existing_file(self, temp_dir):
+        """Test that exceeding the limit while streaming keeps the old destination."""
+        dest = temp_dir / "file.bin"
+        dest.write_bytes(b"original")
+
+        with _fake_open_url(b"x" * 5000), \
+             patch.object(network, "MAX_DOWNLOAD_SIZE", 4000), \
+             patch.object(network, "DOWNLOAD_CHUNK_SIZE", 1000):
+            result = network.download_file("https://example.com/file.bin", str(dest), auto_confirm=True)
+
+        assert result["success"] is False
+        assert "too large" in result["error"]
+        assert dest.read_bytes() == b"original"
+        assert not (temp_dir / "file.bin.part").exists()
+
+
+# ============================================================================
+# Test search_web
+# ============================================================================
+
+SEARCH_HTML = """
+<a rel="nofollow" class="result__a" href="https://example.com/1">First &amp; Best</a>
+<a class="result__snippet" href="x">Snippet one</a>
+<a rel="nofollow" class="result__a" href="https://example.com/2">Second</a>
+<a class="result__snippet" href="x">Snippet &lt;two&gt;</a>
+<a rel="nofollow" class="result__a" href="https://example.com/3">Third</a>
+"""
+
+
+
+class TestSearchWeb:
+    """Tests for search_web function."""
+
+    @pytest.mark.unit
+    def test_results_parsed(self):
+        """Test that titles, URLs and snippets are extracted and unescaped."""
+        with _fake_open_url(SEARCH_HTML):
+            result = network.search_web("test query", num_results=5)
+
+        assert result["success"] is True
+        assert result["num_results"] == 3
+        assert result["results"][0] == {
+            "title": "First & Best",
+            "url": "https://example.com/1",
+            "snippet": "Snippet one",
+        }
+        assert result["results"][1]["snippet"] == "Snippet <two>"
+        assert result["results"][2]["snippet"] == ""
+
+    @pytest.mark.unit
+    def test_num_results_limit(self):
+        """Test that at most num_results results are returned."""
+        with _fake_open_url(SEARCH_HTML):
+            result = network.search_web("test query", num_results=2)
+
+        assert result["num_results"] == 2
+        assert [r["url"] for r in result["results"]] == [
+            "https://example.com/1",
+            "https://example.com/2",
+        ]
+
+    @pytest.mark.unit
+    def test_page_read_stops_after_needed_results(self):
+        """Test that the page is only read until the requested snippets are complete."""
+        page = (SEARCH_HTML + "x" * 100_000).encode("utf-8")
+        response = _FakeResponse(page)
+
+        with patch.object(network, "SEARCH_READ_CHUNK", 64), \
+             patch.object(network, "SEARCH_DRAIN_LIMIT", 256):
+            html_content = network._read_search_page(response, 1)
+
+        assert "Snippet one" in html_content
+        assert response.tell() < len(SEARCH_HTML) + 64 + 256
+
+    @pytest.mark.unit
+    def test_parsers_agree(self):
+        """Test that the selectolax and regex parsers return the same results."""
+        pytest.importorskip("selectolax.lexbor")
+
+        assert network._parse_results_lexbor(SEARCH_HTML, 10) == network._parse_results_regex(SEARCH_HTML, 10)
+
+    @pytest.mark.unit
+    def test_parser_keeps_highlighted_snippet(self):
+        """Test that snippets with highlighted terms keep their text."""
+        pytest.importorskip("selectolax.lexbor")
+        page = SEARCH_HTML.replace("Snippet one", "Snippet <b>one</b>")
+
+        results = network._parse_results_lexbor(page, 10)
+
+        assert results[0]["snippet"] == "Snippet one"
+        assert results[1]["snippet"] == "Snippet <two>"
+
+    @pytest.mark.unit
+    def test_no_results(self):
+        """Test that an empty page is reported as failure."""
+        with _fake_open_url("<html></html>"):
+            result = network.search_web("test query")
+
+        assert result["success"] is False
+        assert "error" in result
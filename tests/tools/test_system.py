@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for mistralcli.tools.system
+
+Tests the Bash command helpers:
+- Detection of commands that can run without a shell
+- execute_bash_command
+- User confirmation
+
+Version: 1.5.2
+"""
+
+import io
+import pytest
+
+from mistralcli.tools.system import (
+    _split_simple_command,
+    _get_user_confirmation,
+    execute_bash_command,
+    set_confirmation_handler,
+)
+
+
+# ============================================================================
+# Test _split_simple_command
+# ============================================================================
+
+class TestSplitSimpleCommand:
+    """Tests for _split_simple_command function."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("command,expected", [
+        ("ls -la", ["ls", "-la"]),
+        ("echo 'hello world'", ["echo", "hello world"]),
+        ('grep -n "foo bar" file.txt', ["grep", "-n", "foo bar", "file.txt"]),
+        ("ls --color=auto", ["ls", "--color=auto"]),
+    ])
+    def test_simple_commands_split(self, command, expected):
+        """Test that simple commands are split into arguments."""
+        assert _split_simple_command(command) == expected
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("command", [
+        "ls | wc -l",
+        "echo a && echo b",
+        "echo a; echo b",
+        "echo $HOME",
+        "echo `date`",
+        "echo $(date)",
+        "ls *.txt",
+        "ls ~",
+        "echo hi > out.txt",
+        "echo hi # comment",
+        "FOO=bar env",
+        "cd /tmp",
+        "echo 'unterminated",
+        "",
+    ])
+    def test_shell_commands_not_split(self, command):
+        """Test that commands needing a shell are not split."""
+        assert _split_simple_command(command) is None
+
+
+# ============================================================================
+# Test execute_bash_command
+# ============================================================================
+
+class TestExecuteBashCommand:
+    """Tests for execute_bash_command function."""
+
+    @pytest.mark.unit
+    def test_simple_command_without_shell(self):
+        """Test that a simple command runs without a shell."""
+        result = execute_bash_command("echo hello", "Test", auto_confirm=True)
+
+        assert result["success"] is True
+        assert result["output"] == "hello\n"
+        assert result["exit_code"] == 0
+
+    @pytest.mark.unit
+    def test_shell_command(self):
+        """Test that commands with shell syntax still run through the shell."""
+        result = execute_bash_command("echo hello | tr a-z A-Z", "Test", auto_confirm=True)
+
+        assert result["success"] is True
+        assert result["output"] == "HELLO\n"
+
+    @pytest.mark.unit
+    def test_exit_code(self):
+        """Test that a failing command reports its exit code."""
+        result = execute_bash_command("false", "Test", auto_confirm=True)
+
+        assert result["success"] is False
+        assert result["exit_code"] == 1
+
+    @pytest.mark.unit
+    def test_non_utf8_output(self):
+        """Test that invalid UTF-8 output is replaced instead of failing."""
+        result = execute_bash_command("printf 'a\\377b\\r\\n'", "Test", auto_confirm=True)
+
+        assert result["success"] is True
+        assert result["output"] == "a\ufffdb\n"
+
+
+# ============================================================================
+# Test _get_user_confirmation
+# ============================================================================
+
+class TestGetUserConfirmation:
+    """Tests for _get_user_confirmation with piped stdin."""
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("answer,expected", [
+        ("y\n", True),
+        ("JA\n", True),
+        ("  yes  \n", True),
+        ("n\n", False),
+        ("", False),
+    ])
+    def test_piped_answers(self, monkeypatch, capsys, answer, expected):
+        """Test answers read from a non-terminal stdin."""
+        monkeypatch.setattr("sys.stdin", io.StringIO(answer))
+
+        assert _get_user_confirmation("Run?") is expected
+        assert capsys.readouterr().out == "  Run? (y/n): "
+
+    @pytest.mark.unit
+    def test_confirmation_handler(self, monkeypatch):
+        """Test that a registered handler answers instead of stdin."""
+        prompts = []
+        monkeypatch.setattr("sys.stdin", io.StringIO("y\n"))
+
+        set_confirmation_handler(lambda prompt: prompts.append(prompt) or False)
+        try:
+            assert _get_user_confirmation("Write?") is False
+        finally:
+            set_confirmation_handler(None)
+
+        assert prompts == ["Write?"]
+        assert _get_user_confirmation("Write?") is True
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for mistralcli.utils.serialization
+
+Tests the JSON helpers used for tool arguments and results.
+
+Version: 1.5.2
+"""
+
+import json
+import pytest
+
+from mistralcli.utils.serialization import json_loads, json_dumps
+
+
+# ============================================================================
+# Test json_loads / json_dumps
+# ============================================================================
+
+class TestJsonHelpers:
+    """Tests for json_loads and json_dumps."""
+
+    @pytest.mark.unit
+    def test_round_trip(self):
+        """Test that tool results survive a round trip."""
+        result = {"success": True, "content": "Hello 世界", "size": (640, 480)}
+
+        assert json_loads(json_dumps(result)) == {
+            "success": True, "content": "Hello 世界", "size": [640, 480]
+        }
+
+    @pytest.mark.unit
+    def test_dumps_compact_utf8(self):
+        """Test that output is compact and not ASCII-escaped."""
+        assert json_dumps({"a": [1, "ä"]}) == '{"a":[1,"ä"]}'
+
+    @pytest.mark.unit
+    def test_dumps_none_key(self):
+        """Test that None keys (extra CSV fields) serialize like the json module."""
+        assert json_loads(json_dumps({None: ["3"]})) == {"null": ["3"]}
+
+    @pytest.mark.unit
+    def test_large_integer(self):
+        """Test integers beyond 64 bit in both directions."""
+        big = 123456789012345678901234567890
+
+        assert json_loads(json_dumps({"n": big})) == {"n": big}
+
+    @pytest.mark.unit
+    def test_invalid_json_raises_decode_error(self):
+        """Test that invalid input raises json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            json_loads("{invalid")
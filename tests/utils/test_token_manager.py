@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Unit Tests for mistralcli.utils.token_manager
+
+Tests trimming of the chat history and cutting of tool results.
+
+Version: 1.5.2
+"""
+
+import pytest
+from unittest.mock import patch
+
+from mistralcli.utils import token_manager
+from mistralcli.utils.token_manager import estimate_tokens, trim_messages, truncate_tool_content
+
+
+class _FakeEncoding:
+    """Encodes one token per word."""
+
+    def encode(self, text, disallowed_special=()):
+        return text.split()
+
+
+# ============================================================================
+# Test estimate_tokens
+# ============================================================================
+
+class TestEstimateTokens:
+    """Tests for estimate_tokens function."""
+
+    @pytest.mark.unit
+    def test_length_estimate_without_tiktoken(self):
+        """Test the ~4 characters per token fallback."""
+        with patch.object(token_manager, "_encoding", False):
+            assert estimate_tokens("a" * 40) == 10
+
+    @pytest.mark.unit
+    def test_tiktoken_count_cached(self):
+        """Test that BPE counts are used and cached per text."""
+        token_manager._count_tokens.cache_clear()
+        with patch.object(token_manager, "_encoding", _FakeEncoding()):
+            assert estimate_tokens("one two three") == 3
+            assert estimate_tokens("one two three") == 3
+            assert token_manager._count_tokens.cache_info().hits == 1
+        token_manager._count_tokens.cache_clear()
+
+
+# ============================================================================
+# Test trim_messages
+# ============================================================================
+
+@pytest.fixture
+def length_estimate():
+    """Counts tokens by length, independent of an installed tiktoken."""
+    with patch.object(token_manager, "_encoding", False):
+        yield
+
+
+@pytest.mark.usefixtures("length_estimate")
+class TestTrimMessages:
+    """Tests for trim_messages function."""
+
+    @pytest.mark.unit
+    def test_keeps_system_and_newest(self):
+        """Test that the system message and the newest messages are kept."""
+        messages = [
+            {"role": "system", "content": "s"},
+            {"role": "user", "content": "a" * 400},
+            {"role": "user", "content": "b" * 40},
+        ]
+
+        assert trim_messages(messages, max_tokens=50) == [messages[0], messages[2]]
+
+    @pytest.mark.unit
+    def test_no_leading_tool_results(self):
+        """Test that tool results cut off from their tool call are dropped."""
+        messages = [
+            {"role": "assistant", "content": "x" * 400, "tool_calls": []},
+            {"role": "tool", "content": "r"},
+            {"role": "assistant", "content": "done"},
+        ]
+
+        assert trim_messages(messages, max_tokens=50) == [messages[2]]
+
+
+# ============================================================================
+# Test truncate_tool_content
+# ============================================================================
+
+class TestTruncateToolContent:
+    """Tests for truncate_tool_content function."""
+
+    @pytest.mark.unit
+    def test_short_content_unchanged(self):
+        """Test that content within the limit is returned as is."""
+        assert truncate_tool_content("abc", max_chars=3) == "abc"
+
+    @pytest.mark.unit
+    def test_long_content_cut(self):
+        """Test that long content is cut with a note on the removed length."""
+        assert truncate_tool_content("abcdef", max_chars=2) == "ab... <truncated 4 chars>"